@@ -0,0 +1,207 @@
+"""
+Over-allocation and missing-timesheet alerts for the whole company.
+
+Compares everyone's booked hours with their available hours (WeeklyHours less
+public holidays of their office) for the coming weeks in one vectorized pass
+and flags:
+    over_allocated    booked more than the available hours
+    under_allocated   booked something, but less than UNDER_ALLOCATION_RATIO of it
+    empty_week        nothing booked in a week with available hours
+    stale_skills      skills never updated, or not within STALE_SKILLS_DAYS
+
+Results go to `data/alerts.csv`, which the app shows as a sidebar banner.
+The app can also rescan in a background thread (ALERT_SCAN_INTERVAL seconds,
+0 disables it).
+
+Usage:
+    python alerts.py
+    python alerts.py --weeks 8 --stale-days 90 --out alerts.csv
+"""
+
+import argparse
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from calendars import capacity_matrix
+from utils import (
+    EMPLOYEES_COLUMNS,
+    EMPLOYEES_FILE,
+    ENTRIES_COLUMNS,
+    ENTRIES_FILE,
+    SKILLS_COLUMNS,
+    SKILLS_FILE,
+    load_csv,
+    save_csv,
+    week_window,
+)
+
+ALERTS_FILE = "data/alerts.csv"
+ALERT_COLUMNS = ["Name", "Week", "Type", "Hours", "Available", "Days"]
+ALERT_WEEKS = 5
+UNDER_ALLOCATION_RATIO = 0.5
+STALE_SKILLS_DAYS = 180
+ALERT_SCAN_INTERVAL = float(os.environ.get("ALERT_SCAN_INTERVAL", "0"))
+
+
+def scan(
+    entries_df,
+    employees_df,
+    skills_df,
+    week_dates,
+    under_ratio=UNDER_ALLOCATION_RATIO,
+    stale_days=STALE_SKILLS_DAYS,
+):
+    """
+    Checks every employee and week in one pass.
+
+    Parameters:
+        entries_df (pd.DataFrame): Entries store.
+        employees_df (pd.DataFrame): Employees with Name, Office and WeeklyHours.
+        skills_df (pd.DataFrame): Skills matrix with LastUpdated.
+        week_dates (list[date]): Mondays of the weeks to check.
+        under_ratio (float): Share of the available hours below which a week is under-allocated.
+        stale_days (int): Skills not updated within this many days are stale.
+
+    Returns:
+        pd.DataFrame: One row per alert with Name, Week, Type, Hours, Available and Days.
+                      Week alerts leave Days empty; skill alerts leave Week, Hours and
+                      Available empty and carry the days since the last update in Days
+                      (empty if the skills were never updated).
+    """
+    week_strs = [week.strftime("%d-%b") for week in week_dates]
+    capacity = capacity_matrix(employees_df, week_dates, week_strs)
+    names = capacity.index
+    booked = (
+        entries_df[entries_df["Week"].isin(week_strs)]
+        .pivot_table(index="Name", columns="Week", values="Hours", aggfunc="sum")
+        .reindex(index=names, columns=week_strs)
+        .fillna(0)
+        .to_numpy()
+    )
+    available = capacity.to_numpy()
+
+    checks = {
+        "over_allocated": booked > available,
+        "under_allocated": (booked > 0) & (booked < available * under_ratio),
+        "empty_week": (booked == 0) & (available > 0),
+    }
+    alerts = []
+    for alert_type, mask in checks.items():
+        rows, cols = np.nonzero(mask)
+        alerts.append(
+            pd.DataFrame(
+                {
+                    "Name": names[rows],
+                    "Week": np.asarray(week_strs, dtype=object)[cols],
+                    "Type": alert_type,
+                    "Hours": booked[rows, cols],
+                    "Available": available[rows, cols],
+                }
+            )
+        )
+
+    # The app writes ISO dates; older rows were entered as day/month/year
+    updated = skills_df["LastUpdated"]
+    updated = pd.to_datetime(updated, format="%Y-%m-%d", errors="coerce").fillna(
+        pd.to_datetime(updated, format="%d/%m/%Y", errors="coerce")
+    )
+    last_updated = (
+        updated.groupby(skills_df["Name"])
+        .max()
+        .reindex(names)
+    )
+    age = (pd.Timestamp.today().normalize() - last_updated).dt.days
+    stale = last_updated.isna() | (age > stale_days)
+    alerts.append(
+        pd.DataFrame(
+            {
+                "Name": names[stale.to_numpy()],
+                "Week": None,
+                "Type": "stale_skills",
+                "Hours": None,
+                "Available": None,
+                "Days": age[stale].to_numpy(),
+            }
+        )
+    )
+
+    alerts = [alert for alert in alerts if not alert.empty]
+    if not alerts:
+        return pd.DataFrame(columns=ALERT_COLUMNS)
+    return pd.concat(alerts, ignore_index=True)[ALERT_COLUMNS]
+
+
+def scan_files(week_dates=None, out_file=ALERTS_FILE, **kwargs):
+    """
+    Scans the data files and writes the alerts to `out_file`.
+    """
+    alerts = scan(
+        load_csv(ENTRIES_FILE, ENTRIES_COLUMNS),
+        load_csv(EMPLOYEES_FILE, EMPLOYEES_COLUMNS),
+        load_csv(SKILLS_FILE, SKILLS_COLUMNS),
+        week_dates or week_window(ALERT_WEEKS),
+        **kwargs,
+    )
+    save_csv(alerts, out_file)
+    return alerts
+
+
+def load_alerts(file=ALERTS_FILE):
+    return load_csv(file, ALERT_COLUMNS)
+
+
+class AlertScanner:
+    """
+    Background thread that rescans the data files every `interval` seconds.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="alert-scanner", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                scan_files()
+            except Exception as e:
+                print(f"⚠️ Alert scan failed: {e}")
+            self._stop.wait(self.interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scan the plan for allocation alerts.")
+    parser.add_argument(
+        "--weeks", type=int, default=ALERT_WEEKS, help="Weeks to check from the current week"
+    )
+    parser.add_argument("--under-ratio", type=float, default=UNDER_ALLOCATION_RATIO)
+    parser.add_argument("--stale-days", type=int, default=STALE_SKILLS_DAYS)
+    parser.add_argument("--out", default=ALERTS_FILE, help="CSV to write the alerts to")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    alerts = scan_files(
+        week_window(args.weeks),
+        args.out,
+        under_ratio=args.under_ratio,
+        stale_days=args.stale_days,
+    )
+    elapsed = time.perf_counter() - start
+    counts = alerts["Type"].value_counts()
+    summary = ", ".join(f"{count} {alert_type}" for alert_type, count in counts.items())
+    print(f"🚨 {len(alerts)} alerts ({summary or 'none'}) in {elapsed:.2f}s → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+"""
+Staffing proposals for Tentative project demand.
+
+Capacity is each employee's `WeeklyHours` minus what they already booked as
+Confirmed, BD or Leave. Demand (hours per project and week, optionally with
+required skills) is assigned to eligible employees so the company-wide
+over-allocation is as small as possible.
+
+Two methods are available:
+    greedy  Water-fills each project into the employees with the most free hours,
+            vectorized over all weeks at once. No extra dependencies.
+    exact   Returns the minimum possible over-allocation by solving a maximum
+            flow over all weeks with SciPy's sparse graph solver. Requires `scipy`.
+
+Usage:
+    python allocation.py                          # re-staff current Tentative demand
+    python allocation.py --demand demand.csv --method exact --out proposals.csv
+
+A demand CSV has the columns Project, Week, Hours and optionally Skills
+(required skills separated by ';').
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils import (
+    EMPLOYEES_COLUMNS,
+    EMPLOYEES_FILE,
+    ENTRIES_COLUMNS,
+    ENTRIES_FILE,
+    SKILLS_COLUMNS,
+    SKILLS_FILE,
+    load_csv,
+)
+
+SKILL_LEVELS = ["Beginner", "Intermediate", "Expert"]
+BOOKED_STATUSES = ["Confirmed", "BD", "Leave"]
+PROPOSAL_COLUMNS = ["Project", "Week", "Name", "Hours"]
+
+
+def demand_from_tentative(entries_df):
+    """
+    Uses the hours currently booked as Tentative as project demand.
+
+    Returns:
+        pd.DataFrame: Project, Week, Hours and an empty Skills column.
+    """
+    tentative = entries_df[entries_df["Status"] == "Tentative"]
+    demand = tentative.groupby(["Project", "Week"], sort=False)["Hours"].sum().reset_index()
+    demand["Skills"] = ""
+    return demand[demand["Hours"] > 0].reset_index(drop=True)
+
+
+def capacity_matrix(employees_df, entries_df, weeks):
+    """
+    Free hours per employee and week.
+
+    Returns:
+        pd.DataFrame: Employees as rows, weeks as columns. Negative values mean the
+                      employee is already over-allocated by Confirmed/BD/Leave hours.
+    """
+    names = employees_df["Name"].dropna().unique()
+    weekly_hours = (
+        employees_df.drop_duplicates("Name")
+        .set_index("Name")["WeeklyHours"]
+        .reindex(names)
+        .astype(float)
+        .to_numpy()
+    )
+    booked = entries_df[entries_df["Status"].isin(BOOKED_STATUSES)]
+    booked = (
+        booked.pivot_table(index="Name", columns="Week", values="Hours", aggfunc="sum")
+        .reindex(index=names, columns=weeks)
+        .fillna(0)
+        .to_numpy()
+    )
+    return pd.DataFrame(weekly_hours[:, None] - booked, index=names, columns=weeks)
+
+
+def eligibility_matrix(demand_df, skills_df, names, min_level="Beginner"):
+    """
+    Which employees may work on which project.
+
+    An employee is eligible when they hold every required skill of the project at
+    `min_level` or above. Projects without required skills accept everyone.
+
+    Returns:
+        pd.DataFrame: Projects as rows, employees as columns, boolean values.
+    """
+    projects = demand_df["Project"].unique()
+    levels = SKILL_LEVELS[SKILL_LEVELS.index(min_level) :]
+    held = skills_df[skills_df["Level"].isin(levels)]
+    held = pd.crosstab(held["Skill"], held["Name"]).reindex(columns=names, fill_value=0) > 0
+
+    eligible = np.ones((len(projects), len(names)), dtype=bool)
+    required = (
+        demand_df.drop_duplicates("Project")
+        .set_index("Project")["Skills"]
+        .reindex(projects)
+        .fillna("")
+    )
+    for i, skills in enumerate(required):
+        for skill in (s.strip() for s in str(skills).split(";")):
+            if not skill:
+                continue
+            if skill in held.index:
+                eligible[i] &= held.loc[skill].to_numpy()
+            else:
+                eligible[i] = False
+    return pd.DataFrame(eligible, index=projects, columns=names)
+
+
+def _demand_matrix(demand_df, weeks):
+    return (
+        demand_df.pivot_table(index="Project", columns="Week", values="Hours", aggfunc="sum")
+        .reindex(index=demand_df["Project"].unique(), columns=weeks)
+        .fillna(0)
+    )
+
+
+def _allocate_greedy(demand, capacity, eligible):
+    """
+    Water-fills each project into the eligible employees with the most free hours.
+
+    Projects with the fewest eligible employees go first so flexible projects take
+    what is left. Demand above the eligible free hours goes to the eligible employee
+    with the most free hours that week.
+    """
+    remaining = capacity.copy()
+    allocation = np.zeros((demand.shape[0],) + capacity.shape)
+
+    for p in np.argsort(eligible.sum(axis=1), kind="stable"):
+        candidates = np.flatnonzero(eligible[p])
+        if candidates.size == 0:
+            continue
+        free = remaining[candidates]
+        order = np.argsort(-free, axis=0, kind="stable")
+        free_sorted = np.clip(np.take_along_axis(free, order, axis=0), 0, None)
+        filled_before = np.cumsum(free_sorted, axis=0) - free_sorted
+        assigned_sorted = np.clip(demand[p] - filled_before, 0, free_sorted)
+        assigned_sorted[0] += np.clip(demand[p] - free_sorted.sum(axis=0), 0, None)
+
+        assigned = np.zeros_like(free)
+        np.put_along_axis(assigned, order, assigned_sorted, axis=0)
+        allocation[p, candidates] = assigned
+        remaining[candidates] -= assigned
+
+    return allocation
+
+
+def _allocate_exact(demand, capacity, eligible):
+    """
+    Minimises the over-allocation exactly with a maximum flow.
+
+    Over-allocation only costs once an employee's free hours are used up, so the
+    smallest over-allocation is the demand left after pushing as much of it as
+    possible through free hours: a max-flow from projects to eligible employees
+    capped by their free hours. All weeks are solved in one graph of disjoint
+    week layers. Whatever demand is left goes to the eligible employee with the
+    most free hours, where every hour counts as over-allocation whatever the choice.
+    """
+    try:
+        from scipy.sparse import csr_matrix
+        from scipy.sparse.csgraph import maximum_flow
+    except ImportError as e:
+        raise ImportError(
+            "The 'exact' method requires scipy (pip install scipy); use 'greedy' instead."
+        ) from e
+
+    n_projects, n_weeks = demand.shape
+    n_employees = capacity.shape[0]
+    layer = n_projects + n_employees
+    source, sink = 0, n_weeks * layer + 1
+
+    # Capacities in hundredths of an hour, since the solver needs integers
+    demand_int = np.round(demand * 100).astype(np.int64)
+    free_int = np.round(np.clip(capacity, 0, None) * 100).astype(np.int64)
+    staffable = (demand_int > 0) & eligible.any(axis=1)[:, None]
+
+    def project_node(p, w):
+        return 1 + w * layer + p
+
+    def employee_node(e, w):
+        return 1 + w * layer + n_projects + e
+
+    src_p, src_w = np.nonzero(staffable)
+    pair_p, pair_e = np.nonzero(eligible)
+    pair_mask = staffable[pair_p]  # pairs x weeks
+    pe_idx, pe_w = np.nonzero(pair_mask)
+    sink_e, sink_w = np.nonzero(free_int > 0)
+
+    pe_from = project_node(pair_p[pe_idx], pe_w)
+    pe_to = employee_node(pair_e[pe_idx], pe_w)
+    rows = np.concatenate([np.full(src_p.size, source), pe_from, employee_node(sink_e, sink_w)])
+    cols = np.concatenate([project_node(src_p, src_w), pe_to, np.full(sink_e.size, sink)])
+    caps = np.concatenate(
+        [
+            demand_int[src_p, src_w],
+            demand_int[pair_p[pe_idx], pe_w],
+            free_int[sink_e, sink_w],
+        ]
+    )
+    graph = csr_matrix((caps.astype(np.int32), (rows, cols)), shape=(sink + 1, sink + 1))
+
+    flow = maximum_flow(graph, source, sink, method="dinic").flow
+    allocation = np.zeros((n_projects, n_employees, n_weeks))
+    allocation[pair_p[pe_idx], pair_e[pe_idx], pe_w] = (
+        np.asarray(flow[pe_from, pe_to]).ravel() / 100
+    )
+
+    # Demand the free hours could not absorb is over-allocation wherever it goes
+    remaining = capacity - allocation.sum(axis=0)
+    leftover = np.where(staffable, demand - allocation.sum(axis=1), 0)
+    week_idx = np.arange(n_weeks)
+    for p in np.flatnonzero((leftover > 1e-9).any(axis=1)):
+        candidates = np.flatnonzero(eligible[p])
+        target = candidates[np.argmax(remaining[candidates], axis=0)]
+        allocation[p, target, week_idx] += leftover[p]
+        remaining[target, week_idx] -= leftover[p]
+
+    return allocation
+
+
+def propose_allocation(
+    demand_df, employees_df, entries_df, skills_df, method="greedy", min_level="Beginner"
+):
+    """
+    Proposes who should work on which demand.
+
+    Parameters:
+        demand_df (pd.DataFrame): Project, Week, Hours and optional Skills (';'-separated).
+        employees_df (pd.DataFrame): Employees with Name and WeeklyHours.
+        entries_df (pd.DataFrame): Entries store; Confirmed, BD and Leave hours reduce capacity.
+        skills_df (pd.DataFrame): Skills matrix used for eligibility.
+        method (str): "greedy" or "exact".
+        min_level (str): Lowest skill level that counts as holding a skill.
+
+    Returns:
+        tuple[pd.DataFrame, dict]: Proposed Project, Week, Name, Hours rows and a summary with
+                                   the total demand, new over-allocation and unstaffable hours.
+    """
+    if method not in ("greedy", "exact"):
+        raise ValueError(f"Unknown method '{method}', expected 'greedy' or 'exact'.")
+
+    demand_df = demand_df.copy()
+    if "Skills" not in demand_df.columns:
+        demand_df["Skills"] = ""
+    demand_df["Hours"] = pd.to_numeric(demand_df["Hours"], errors="coerce").fillna(0)
+    weeks = list(demand_df["Week"].unique())
+
+    capacity = capacity_matrix(employees_df, entries_df, weeks)
+    names = capacity.index
+    eligible = eligibility_matrix(demand_df, skills_df, names, min_level)
+    demand = _demand_matrix(demand_df, weeks)
+
+    allocate = _allocate_exact if method == "exact" else _allocate_greedy
+    allocation = allocate(demand.to_numpy(), capacity.to_numpy(), eligible.to_numpy())
+
+    p_idx, e_idx, w_idx = np.nonzero(allocation > 1e-9)
+    proposals = pd.DataFrame(
+        {
+            "Project": demand.index[p_idx],
+            "Week": np.asarray(weeks, dtype=object)[w_idx],
+            "Name": names[e_idx],
+            "Hours": allocation[p_idx, e_idx, w_idx].round(2),
+        },
+        columns=PROPOSAL_COLUMNS,
+    )
+
+    free = np.clip(capacity.to_numpy(), 0, None)
+    overtime = np.clip(allocation.sum(axis=0) - free, 0, None)
+    summary = {
+        "demand_hours": float(demand.to_numpy().sum()),
+        "over_allocation_hours": float(overtime.sum()),
+        "unstaffable_hours": float(demand.to_numpy()[~eligible.any(axis=1).to_numpy()].sum()),
+        "unstaffable_projects": eligible.index[~eligible.any(axis=1)].tolist(),
+    }
+    return proposals, summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Propose staffing for project demand.")
+    parser.add_argument(
+        "--demand",
+        help="Demand CSV (Project, Week, Hours, Skills); defaults to current Tentative hours",
+    )
+    parser.add_argument("--method", choices=["greedy", "exact"], default="greedy")
+    parser.add_argument("--min-level", choices=SKILL_LEVELS, default="Beginner")
+    parser.add_argument("--out", help="Write the proposals to this CSV")
+    args = parser.parse_args()
+
+    entries_df = load_csv(ENTRIES_FILE, ENTRIES_COLUMNS)
+    demand_df = (
+        pd.read_csv(args.demand) if args.demand else demand_from_tentative(entries_df)
+    )
+
+    start = time.perf_counter()
+    proposals, summary = propose_allocation(
+        demand_df,
+        load_csv(EMPLOYEES_FILE, EMPLOYEES_COLUMNS),
+        entries_df,
+        load_csv(SKILLS_FILE, SKILLS_COLUMNS),
+        method=args.method,
+        min_level=args.min_level,
+    )
+    elapsed = time.perf_counter() - start
+
+    if args.out:
+        proposals.to_csv(args.out, index=False)
+    else:
+        print(proposals.to_string(index=False))
+    print(
+        f"📋 {summary['demand_hours']:.1f} h demand, "
+        f"{summary['over_allocation_hours']:.1f} h over-allocation, "
+        f"{summary['unstaffable_hours']:.1f} h unstaffable "
+        f"({args.method}, {elapsed:.2f}s)"
+    )
+    if summary["unstaffable_projects"]:
+        print(f"⚠️ No eligible employees for: {', '.join(summary['unstaffable_projects'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""
+Read-only HTTP/JSON API over the planner data.
+
+Serves the same pivots and aggregations as the Streamlit app without running
+it. Every response carries a content-hash ETag (`utils.hash_df` of the result plus
+its column labels) and honours `If-None-Match`, so pollers get a bodiless 304 while nothing has
+changed. Results are cached per request until one of the data files changes.
+
+Endpoints:
+    GET /employees
+    GET /employees/<name>/pivot?status=Confirmed&weeks=28-Jul,04-Aug
+    GET /heatmap?weeks=28-Jul,04-Aug
+    GET /skills?category=Coding&skill=python&name=Kath
+    GET /export.ndjson?data=entries|skills|employees   (streamed, one JSON row per line)
+
+`weeks` defaults to the current week and the ten after it, like the app.
+
+Usage:
+    python api.py --port 8502
+"""
+
+import argparse
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+from charts import heatmap_matrix
+from utils import (
+    EMPLOYEES_COLUMNS,
+    EMPLOYEES_FILE,
+    ENTRIES_COLUMNS,
+    ENTRIES_FILE,
+    SKILLS_COLUMNS,
+    SKILLS_FILE,
+    STATUSES,
+    default_week_strs,
+    file_mtime,
+    hash_df,
+    load_csv,
+    pivot_entries,
+)
+
+DATA_FILES = {
+    "entries": (ENTRIES_FILE, ENTRIES_COLUMNS),
+    "skills": (SKILLS_FILE, SKILLS_COLUMNS),
+    "employees": (EMPLOYEES_FILE, EMPLOYEES_COLUMNS),
+}
+DEFAULT_WEEKS = 11
+EXPORT_CHUNK_ROWS = 1000
+RESPONSE_CACHE_SIZE = 256
+
+
+class NotFound(Exception):
+    pass
+
+
+def etag(df):
+    # hash_df only covers values, so equal hours under other week columns would match
+    labels = json.dumps([str(column) for column in df.columns])
+    return '"' + hashlib.md5((hash_df(df) + labels).encode("utf-8")).hexdigest() + '"'
+
+
+class DataStore:
+    """
+    Loaded data files and computed responses, reused until a data file changes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._frames = {}
+        self._responses = OrderedDict()
+
+    def version(self):
+        return tuple(file_mtime(file) for file, _ in DATA_FILES.values())
+
+    def frame(self, name):
+        file, columns = DATA_FILES[name]
+        mtime = file_mtime(file)
+        with self._lock:
+            cached = self._frames.get(name)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+        df = load_csv(file, columns)
+        with self._lock:
+            self._frames[name] = (mtime, df)
+        return df
+
+    def response(self, key, build):
+        """
+        Returns (etag, body) for a request key, building the result only when the
+        data changed since it was last served. The key must hold every resolved
+        parameter, including defaults such as the current week window.
+        """
+        key = (key, self.version())
+        with self._lock:
+            if key in self._responses:
+                self._responses.move_to_end(key)
+                return self._responses[key]
+
+        df = build()
+        result = (etag(df), df.to_json(orient="records").encode("utf-8"))
+        with self._lock:
+            self._responses[key] = result
+            while len(self._responses) > RESPONSE_CACHE_SIZE:
+                self._responses.popitem(last=False)
+        return result
+
+
+def _weeks(query):
+    weeks = query.get("weeks", [""])[0]
+    if not weeks:
+        return default_week_strs(DEFAULT_WEEKS)
+    return [week.strip() for week in weeks.split(",") if week.strip()]
+
+
+def employees_table(store):
+    return store.frame("employees")
+
+
+def pivot_table(store, name, status, weeks):
+    if status not in STATUSES:
+        raise ValueError(f"Unknown status '{status}', expected one of {STATUSES}.")
+    if name not in set(store.frame("employees")["Name"]):
+        raise NotFound(f"Unknown employee '{name}'.")
+    entries = store.frame("entries")
+    return pivot_entries(entries[entries["Name"] == name], status, weeks)
+
+
+def heatmap_table(store, weeks):
+    heatmap = heatmap_matrix(store.frame("entries"), weeks)
+    heatmap.columns = heatmap.columns.astype(str)
+    return heatmap.reindex(columns=weeks, fill_value=0).reset_index()
+
+
+def skills_table(store, category="", skill="", name=""):
+    skills = store.frame("skills")
+    mask = skills["Category"].str.contains(category, case=False, na=False, regex=False)
+    mask &= skills["Skill"].str.contains(skill, case=False, na=False, regex=False)
+    if name:
+        mask &= skills["Name"] == name
+    return skills[mask].sort_values(by=["Skill", "Level"]).reset_index(drop=True)
+
+
+class PlannerAPIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    store = DataStore()
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        parts = [unquote(part) for part in url.path.strip("/").split("/") if part]
+        query = parse_qs(url.query)
+
+        def param(name):
+            return query.get(name, [""])[0]
+
+        try:
+            if parts == ["employees"]:
+                self._send_table(("employees",), lambda: employees_table(self.store))
+            elif len(parts) == 3 and parts[0] == "employees" and parts[2] == "pivot":
+                status = param("status") or "Confirmed"
+                weeks = _weeks(query)
+                self._send_table(
+                    ("pivot", parts[1], status, tuple(weeks)),
+                    lambda: pivot_table(self.store, parts[1], status, weeks),
+                )
+            elif parts == ["heatmap"]:
+                weeks = _weeks(query)
+                self._send_table(
+                    ("heatmap", tuple(weeks)), lambda: heatmap_table(self.store, weeks)
+                )
+            elif parts == ["skills"]:
+                filters = (param("category"), param("skill"), param("name"))
+                self._send_table(
+                    ("skills",) + filters, lambda: skills_table(self.store, *filters)
+                )
+            elif parts == ["export.ndjson"]:
+                self._send_export(param("data") or "entries")
+            else:
+                raise NotFound(f"No route for '{url.path}'.")
+        except NotFound as e:
+            self._send_error(404, str(e))
+        except ValueError as e:
+            self._send_error(400, str(e))
+
+    # ---- Responses ----
+    def _not_modified(self, tag):
+        if_none_match = self.headers.get("If-None-Match", "")
+        tags = [value.strip() for value in if_none_match.split(",")]
+        if tag in tags or "*" in tags:
+            self.send_response(304)
+            self.send_header("ETag", tag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return True
+        return False
+
+    def _send_table(self, key, build):
+        tag, body = self.store.response(key, build)
+        if self._not_modified(tag):
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", tag)
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_export(self, data):
+        if data not in DATA_FILES:
+            raise ValueError(f"Unknown data '{data}', expected one of {list(DATA_FILES)}.")
+        df = self.store.frame(data)
+        tag = etag(df)
+        if self._not_modified(tag):
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.send_header("ETag", tag)
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        for start in range(0, len(df), EXPORT_CHUNK_ROWS):
+            chunk = df.iloc[start : start + EXPORT_CHUNK_ROWS].to_json(
+                orient="records", lines=True
+            )
+            self._write_chunk((chunk.rstrip("\n") + "\n").encode("utf-8"))
+        self._write_chunk(b"")
+
+    def _write_chunk(self, data):
+        self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+
+    def _send_error(self, code, message):
+        body = json.dumps({"error": message}).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve planner data as JSON.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer((args.host, args.port), PlannerAPIHandler)
+    print(f"🌐 Serving planner API on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
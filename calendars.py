@@ -0,0 +1,158 @@
+import os
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+HOLIDAYS_DIR = "data/holidays"
+WORKING_DAYS = 5
+
+
+def holiday_offices():
+    """
+    Offices with a holiday file (`data/holidays/<Office>.csv`).
+    """
+    if not os.path.isdir(HOLIDAYS_DIR):
+        return []
+    return sorted(
+        os.path.splitext(f)[0] for f in os.listdir(HOLIDAYS_DIR) if f.endswith(".csv")
+    )
+
+
+def load_holidays(office):
+    """
+    Loads the public holidays of an office.
+
+    Returns:
+        pd.DataFrame: 'Date' (datetime) and 'Name' columns, empty if the office has no file.
+    """
+    file = os.path.join(HOLIDAYS_DIR, f"{office}.csv")
+    if not os.path.exists(file):
+        return pd.DataFrame({"Date": pd.to_datetime([]), "Name": []})
+    holidays = pd.read_csv(file)
+    holidays["Date"] = pd.to_datetime(holidays["Date"])
+    return holidays[["Date", "Name"]]
+
+
+class CapacityCalendar:
+    """
+    Share of the working week available per office, for every week starting in one year.
+    Attributes:
+        year (int): Calendar year; weeks belong to the year of their Monday.
+        offices (list[str]): Offices with a row in the table.
+        mondays (pd.DatetimeIndex): Monday of every week in the year.
+        available (np.ndarray): Offices x weeks, 1.0 for a full week, 0.8 with one holiday, ...
+    Methods:
+        fraction(office, monday):
+            Available share of one office week; offices without holidays get 1.0.
+    """
+
+    def __init__(self, year, offices):
+        self.year = year
+        self.offices = list(offices)
+        self._office_idx = {office: i for i, office in enumerate(self.offices)}
+
+        first_monday = pd.Timestamp(year, 1, 1) - pd.Timedelta(
+            days=pd.Timestamp(year, 1, 1).weekday()
+        )
+        if first_monday.year < year:
+            first_monday += pd.Timedelta(weeks=1)
+        self.mondays = pd.date_range(first_monday, pd.Timestamp(year, 12, 31), freq="7D")
+
+        holidays = pd.concat(
+            [load_holidays(office).assign(Office=office) for office in self.offices]
+            or [pd.DataFrame(columns=["Date", "Name", "Office"])],
+            ignore_index=True,
+        )
+        holidays["Date"] = pd.to_datetime(holidays["Date"])
+        # Only weekday holidays reduce the working week; several on one day count once
+        holidays = holidays[holidays["Date"].dt.weekday < WORKING_DAYS]
+        holidays = holidays.drop_duplicates(["Office", "Date"])
+        holidays["Monday"] = holidays["Date"] - pd.to_timedelta(
+            holidays["Date"].dt.weekday, unit="D"
+        )
+        days_off = (
+            pd.crosstab(holidays["Office"], holidays["Monday"])
+            .reindex(index=self.offices, columns=self.mondays, fill_value=0)
+            .to_numpy()
+        )
+        self.available = 1 - days_off / WORKING_DAYS
+
+    def fraction(self, office, monday):
+        office_idx = self._office_idx.get(office)
+        if office_idx is None:
+            return 1.0
+        week_idx = (pd.Timestamp(monday) - self.mondays[0]).days // 7
+        return float(self.available[office_idx, week_idx])
+
+
+@lru_cache(maxsize=8)
+def get_calendar(year):
+    """
+    Builds the office x week table of a year once and reuses it.
+    """
+    return CapacityCalendar(year, holiday_offices())
+
+
+def monday_of(day):
+    day = pd.Timestamp(day)
+    return day - pd.Timedelta(days=day.weekday())
+
+
+def office_fractions(offices, week_dates):
+    """
+    Available share of the working week for each office and week.
+
+    Returns:
+        np.ndarray: Offices x weeks.
+    """
+    mondays = [monday_of(day) for day in week_dates]
+    return np.array(
+        [
+            [get_calendar(monday.year).fraction(office, monday) for monday in mondays]
+            for office in offices
+        ]
+    ).reshape(len(offices), len(mondays))
+
+
+def capacity_matrix(employees_df, week_dates, week_labels=None):
+    """
+    Available hours of every employee per week.
+
+    Each office's weeks are looked up once; every person is then one row index into
+    that table scaled by their `WeeklyHours`.
+
+    Parameters:
+        employees_df (pd.DataFrame): Employees with Name, Office and WeeklyHours.
+        week_dates (list[date]): Any day of each week, usually its Monday.
+        week_labels (list[str], optional): Column labels, defaults to the dates.
+
+    Returns:
+        pd.DataFrame: Employees as index, weeks as columns.
+    """
+    employees_df = employees_df.drop_duplicates("Name")
+    office_codes, offices = pd.factorize(employees_df["Office"].fillna(""))
+    fractions = office_fractions(list(offices), week_dates)
+    weekly_hours = (
+        pd.to_numeric(employees_df["WeeklyHours"], errors="coerce").fillna(0).to_numpy()
+    )
+    return pd.DataFrame(
+        weekly_hours[:, None] * fractions[office_codes],
+        index=employees_df["Name"].to_numpy(),
+        columns=week_labels if week_labels is not None else week_dates,
+    )
+
+
+def available_hours(office, weekly_hours, week_dates):
+    """
+    Available hours of a person for each week, after their office's public holidays.
+
+    Parameters:
+        office (str): Office from `employees.csv`.
+        weekly_hours (float): Contracted weekly hours.
+        week_dates (list[date]): Any day of each week, usually its Monday.
+
+    Returns:
+        np.ndarray: Available hours per week.
+    """
+    return weekly_hours * office_fractions([office], week_dates)[0]
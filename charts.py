@@ -0,0 +1,171 @@
+import pandas as pd
+
+from utils import STATUSES
+
+# Altair is only imported when a chart is built, so the planner renders without it
+
+STATUS_COLORS = ["#9dd6fa", "#f0c4f5", "#71f6cc", "#fae996"]
+
+
+def sort_weeks(week_strs):
+    return sorted(week_strs, key=lambda x: pd.to_datetime(x, format="%d-%b"))
+
+
+def weekly_status_totals(entries_df, week_strs):
+    """
+    Sums an employee's hours per week and status for the selected weeks.
+
+    Parameters:
+        entries_df (pd.DataFrame): Entries of one employee.
+        week_strs (list[str]): Selected week strings.
+
+    Returns:
+        pd.DataFrame: 'Week' (ordered categorical), 'Status' and 'Hours' columns.
+    """
+    df_grouped = entries_df.groupby(["Week", "Status"])["Hours"].sum().reset_index()
+
+    # Convert Week to datetime for correct sorting
+    df_grouped["Week_dt"] = pd.to_datetime(df_grouped["Week"], format="%d-%b")
+    week_strs_sorted = sort_weeks(week_strs)
+    df_grouped = df_grouped[df_grouped["Week"].isin(week_strs_sorted)].copy()
+    df_grouped["Week"] = pd.Categorical(
+        df_grouped["Week"], categories=week_strs_sorted, ordered=True
+    )
+    # Filter data to only include selected weeks
+    min_week = week_strs[0]
+    max_week = week_strs[-1]
+    return df_grouped[(df_grouped["Week"] >= min_week) & (df_grouped["Week"] <= max_week)]
+
+
+def status_chart(df_grouped, week_strs, capacity):
+    """
+    Stacked bar chart of weekly hours by status with a line at the available hours.
+
+    `capacity` holds the available hours of each week in `week_strs`.
+    """
+    import altair as alt
+
+    week_strs_sorted = sort_weeks(week_strs)
+    # Base stacked bar chart
+    bar_chart = (
+        alt.Chart(df_grouped)
+        .mark_bar()
+        .encode(
+            x=alt.X("Week:O", title="Week", sort=week_strs_sorted),
+            y=alt.Y("Hours:Q", title="Total Hours", stack="zero"),
+            color=alt.Color(
+                "Status:N",
+                title="Status",
+                scale=alt.Scale(domain=STATUSES, range=STATUS_COLORS),
+            ),
+            tooltip=["Week", "Status", "Hours"],
+        )
+    )
+
+    # Available hours per week (weekly hours less public holidays)
+    util_line = (
+        alt.Chart(pd.DataFrame({"Week": week_strs, "Available": capacity}))
+        .mark_line(color="green", strokeDash=[4, 4], interpolate="step")
+        .encode(
+            x=alt.X("Week:O", sort=week_strs_sorted),
+            y="Available:Q",
+            tooltip=["Week", "Available"],
+        )
+    )
+
+    return (bar_chart + util_line).properties(width=700, height=400)
+
+
+def percentage_chart(df_grouped, week_strs, capacity):
+    """
+    Stacked bar chart of weekly hours by status as a percentage of the available hours.
+
+    `capacity` holds the available hours of each week in `week_strs`.
+    """
+    import altair as alt
+
+    week_strs_sorted = sort_weeks(week_strs)
+    df_grouped = df_grouped.copy()
+    available = pd.Series(capacity, index=week_strs).replace(0, float("nan"))
+    df_grouped["Percentage"] = (
+        df_grouped["Hours"] / df_grouped["Week"].astype(str).map(available) * 100
+    )
+
+    percentage_bars = (
+        alt.Chart(df_grouped)
+        .mark_bar()
+        .encode(
+            x=alt.X("Week:O", title="Week", sort=week_strs_sorted),
+            y=alt.Y("Percentage:Q", title="Percentage of Weekly Hours", stack="zero"),
+            color=alt.Color(
+                "Status:N",
+                title="Status",
+                scale=alt.Scale(domain=STATUSES, range=STATUS_COLORS),
+            ),
+            tooltip=["Week", "Status", "Percentage"],
+        )
+    )
+
+    percentage_line = (
+        alt.Chart(pd.DataFrame({"y": [100]}))
+        .mark_rule(color="green", strokeDash=[4, 4])
+        .encode(y="y:Q")
+    )
+
+    return (percentage_bars + percentage_line).properties(width=700, height=400)
+
+
+def heatmap_matrix(df_all_entries, week_strs):
+    """
+    Total hours of every employee per selected week.
+
+    Returns:
+        pd.DataFrame: Employees as index, selected weeks (in date order) as columns.
+    """
+    all_entries = (
+        df_all_entries.groupby(["Name", "Week"], observed=False)["Hours"]
+        .sum()
+        .reset_index()
+    )
+
+    week_strs_sorted = sort_weeks(week_strs)
+    all_entries["Week"] = pd.Categorical(
+        all_entries["Week"], categories=week_strs_sorted, ordered=True
+    )
+
+    # Ensure unique combinations of Name and Week by aggregating
+    all_entries = (
+        all_entries.groupby(["Name", "Week"], observed=True)["Hours"]
+        .sum()
+        .reset_index()
+    )
+
+    return all_entries.pivot(index="Name", columns="Week", values="Hours").fillna(0)
+
+
+def heatmap_chart(heatmap_data, week_strs, max_hours=40):
+    """
+    Employee x week heatmap of total hours, coloured from 0 to `max_hours`.
+    """
+    import altair as alt
+
+    # Convert to long format for Altair
+    heatmap_long = heatmap_data.reset_index().melt(
+        id_vars="Name", var_name="Week", value_name="Hours"
+    )
+
+    return (
+        alt.Chart(heatmap_long)
+        .mark_rect()
+        .encode(
+            x=alt.X("Week:O", title="Week", sort=sort_weeks(week_strs)),
+            y=alt.Y("Name:O", title="Employee"),
+            color=alt.Color(
+                "Hours:Q",
+                title="Hours",
+                scale=alt.Scale(scheme="reds", domain=[0, max_hours]),
+            ),
+            tooltip=["Name", "Week", "Hours"],
+        )
+        .properties(width=700, height=400)
+    )
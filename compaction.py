@@ -0,0 +1,237 @@
+"""
+Compaction and de-duplication of the entries store.
+
+The write paths append to `entries.csv` with `pd.concat`, so over time the file
+collects duplicate (Name, Status, Project, Week) rows, rows without a `Row`
+value and long runs of zero-hour rows. This module rewrites the file in its
+canonical form in a single vectorized pass.
+
+Usage:
+    python compaction.py                      # compact data/entries.csv in place
+    python compaction.py --how last --dry-run # report only, keep last write per key
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from snapshots import ENTRY_SNAPSHOTS
+from utils import ENTRIES_COLUMNS, ENTRIES_FILE, load_csv, save_csv
+
+ENTRY_KEY = ["Name", "Status", "Project", "Week"]
+PROJECT_KEY = ["Name", "Status", "Project"]
+
+# Compact automatically at load when enabled and the file is this redundant
+AUTO_COMPACT = os.environ.get("AUTO_COMPACT", "0") == "1"
+AUTO_COMPACT_THRESHOLD = 0.2
+
+_last_checked_mtime = {}
+
+
+def _placeholder_rows(df, hours):
+    """
+    Marks the zero-hour row kept for each (Name, Status, Project) without any hours.
+    """
+    nonzero = hours != 0
+    project_has_hours = (
+        nonzero.groupby([df[col] for col in PROJECT_KEY]).transform("any").fillna(True)
+    )
+    first_of_project = ~df.duplicated(PROJECT_KEY)
+    return ~nonzero & ~project_has_hours & first_of_project
+
+
+def compact_entries(df, how="sum", drop_zero=True):
+    """
+    Merges duplicate entries, drops empty rows and restores the `Row` order.
+
+    Parameters:
+        df (pd.DataFrame): Entries with the columns in `ENTRIES_COLUMNS`.
+        how (str): "sum" adds the hours of duplicate keys, "last" keeps the last written row.
+        drop_zero (bool): Drop zero-hour rows. One row is kept per (Name, Status, Project)
+                          so projects without any hours still show up in the planner.
+
+    Returns:
+        pd.DataFrame: Compacted entries, one row per (Name, Status, Project, Week), ordered by
+                      Name, Status and `Row` with `Row` renumbered from 0 per Name and Status.
+    """
+    if how not in ("sum", "last"):
+        raise ValueError(f"Unknown merge mode '{how}', expected 'sum' or 'last'.")
+
+    df = df.reindex(columns=ENTRIES_COLUMNS).dropna(subset=ENTRY_KEY).copy()
+    df["Hours"] = pd.to_numeric(df["Hours"], errors="coerce").fillna(0.0)
+    df["Row"] = pd.to_numeric(df["Row"], errors="coerce")
+    df["_order"] = np.arange(len(df))
+
+    grouped = df.groupby(ENTRY_KEY, sort=False)
+    merged = grouped.agg(
+        Hours=("Hours", how),
+        Row=("Row", "last" if how == "last" else "min"),
+        _order=("_order", "min"),
+    ).reset_index()
+
+    if drop_zero:
+        merged = merged[
+            (merged["Hours"] != 0) | _placeholder_rows(merged, merged["Hours"])
+        ]
+
+    # Canonical order: employees and statuses as first written, then projects by their
+    # stored Row (missing rows last) and first appearance, then weeks as written
+    merged = merged.assign(
+        _name_order=merged.groupby("Name")["_order"].transform("min"),
+        _status_order=merged.groupby(["Name", "Status"])["_order"].transform("min"),
+        _project_row=merged.groupby(PROJECT_KEY)["Row"].transform("min"),
+        _project_order=merged.groupby(PROJECT_KEY)["_order"].transform("min"),
+    ).sort_values(
+        ["_name_order", "_status_order", "_project_row", "_project_order", "_order"],
+        na_position="last",
+        kind="stable",
+    )
+    new_project = ~merged.duplicated(PROJECT_KEY)
+    merged["Row"] = (
+        new_project.groupby([merged["Name"], merged["Status"]]).cumsum() - 1
+    ).astype(int)
+
+    return merged[ENTRIES_COLUMNS].reset_index(drop=True)
+
+
+def redundancy(df):
+    """
+    Returns the share of rows that compaction would remove or rewrite.
+
+    The zero-hour placeholder kept for a project without hours is not redundant,
+    so a compacted file scores 0.
+    """
+    if df.empty:
+        return 0.0
+    hours = pd.to_numeric(df["Hours"], errors="coerce").fillna(0)
+    redundant = (
+        df.duplicated(ENTRY_KEY)
+        | df[ENTRY_KEY].isna().any(axis=1)
+        | df["Row"].isna()
+        | ((hours == 0) & ~_placeholder_rows(df, hours))
+    )
+    return float(redundant.mean())
+
+
+def _time_load(file, repeats=3):
+    # Parse the CSV directly, `load_csv` may serve the original from the pickle cache
+    start = time.perf_counter()
+    for _ in range(repeats):
+        pd.read_csv(file)
+    return (time.perf_counter() - start) / repeats
+
+
+def compact_file(file=ENTRIES_FILE, how="sum", drop_zero=True, dry_run=False):
+    """
+    Compacts an entries CSV and reports the gain.
+
+    Returns:
+        dict: Row counts, file sizes in bytes and mean load times in seconds before and after.
+    """
+    df = load_csv(file, ENTRIES_COLUMNS)
+    compacted = compact_entries(df, how=how, drop_zero=drop_zero)
+
+    # Write next to the original so the load timing is comparable
+    fd, tmp_file = tempfile.mkstemp(
+        suffix=".csv", dir=os.path.dirname(os.path.abspath(file))
+    )
+    os.close(fd)
+    try:
+        save_csv(compacted, tmp_file)
+        report = {
+            "rows_before": len(df),
+            "rows_after": len(compacted),
+            "bytes_before": os.path.getsize(file) if os.path.exists(file) else 0,
+            "bytes_after": os.path.getsize(tmp_file),
+            "load_before": _time_load(file) if os.path.exists(file) else 0.0,
+            "load_after": _time_load(tmp_file),
+        }
+        if not dry_run:
+            is_entries_store = os.path.abspath(file) == os.path.abspath(ENTRIES_FILE)
+            if is_entries_store:
+                ENTRY_SNAPSHOTS.ensure_baseline(df)
+            # save_csv keeps the file's permissions, the temp file is private (0600)
+            save_csv(compacted, file)
+            if is_entries_store:
+                # Summed duplicates and dropped zero rows leave the plan itself unchanged,
+                # so this only records a snapshot if compaction did change hours
+                ENTRY_SNAPSHOTS.record(compacted)
+    finally:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+
+    return report
+
+
+def compact_file_if_needed(file=ENTRIES_FILE, threshold=AUTO_COMPACT_THRESHOLD):
+    """
+    Compacts the file when its redundancy exceeds `threshold`.
+
+    The check only runs when the file changed since the last call, so it is cheap
+    to call on every rerun.
+    """
+    if not os.path.exists(file):
+        return None
+    mtime = os.path.getmtime(file)
+    if _last_checked_mtime.get(file) == mtime:
+        return None
+
+    report = None
+    df = load_csv(file, ENTRIES_COLUMNS)
+    if redundancy(df) > threshold:
+        # Compacting must bring the file under the threshold, or every load would compact again
+        remaining = redundancy(compact_entries(df))
+        if remaining > threshold:
+            print(
+                f"⚠️ Skipped compacting '{file}': still {remaining:.0%} redundant afterwards"
+            )
+        else:
+            report = compact_file(file)
+            print(f"🧹 Compacted '{file}': {format_report(report)}")
+    _last_checked_mtime[file] = os.path.getmtime(file)
+    return report
+
+
+def format_report(report):
+    def pct(before, after):
+        return (1 - after / before) * 100 if before else 0.0
+
+    return (
+        f"{report['rows_before']} → {report['rows_after']} rows, "
+        f"{report['bytes_before'] / 1024:.1f} → {report['bytes_after'] / 1024:.1f} KiB "
+        f"({pct(report['bytes_before'], report['bytes_after']):.0f}% smaller), "
+        f"load {report['load_before'] * 1000:.1f} → {report['load_after'] * 1000:.1f} ms "
+        f"({pct(report['load_before'], report['load_after']):.0f}% faster)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compact the resource planner entries file.")
+    parser.add_argument("--file", default=ENTRIES_FILE, help="Entries CSV to compact")
+    parser.add_argument(
+        "--how",
+        choices=["sum", "last"],
+        default="sum",
+        help="Merge duplicate keys by summing hours or keeping the last write",
+    )
+    parser.add_argument(
+        "--keep-zero", action="store_true", help="Keep zero-hour rows"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Report only, leave the file untouched"
+    )
+    args = parser.parse_args()
+
+    report = compact_file(
+        args.file, how=args.how, drop_zero=not args.keep_zero, dry_run=args.dry_run
+    )
+    prefix = "Would compact" if args.dry_run else "Compacted"
+    print(f"{prefix} '{args.file}': {format_report(report)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,7 @@
 import pandas as pd
 
+from calendars import available_hours
+
 
 class Employee:
     """
@@ -13,6 +15,8 @@ class Employee:
     Methods:
         get_entries_by_status(status):
             Returns a DataFrame of the employee's entries filtered by the given status.
+        available_hours(week_dates):
+            Returns the weekly hours left after the office's public holidays, per week.
         save_entries(df, status, weeks):
             Generates a list of records for the employee based on the provided DataFrame,
             status, and list of weeks. Each record contains employee name, project, week,
@@ -31,6 +35,9 @@ class Employee:
     def get_entries_by_status(self, status):
         return self.entries_df[self.entries_df["Status"] == status]
 
+    def available_hours(self, week_dates):
+        return available_hours(self.office, self.weekly_hours, week_dates)
+
     def save_entries(
         self, df: pd.DataFrame, status: str, weeks: list[str]
     ) -> pd.DataFrame:
@@ -52,20 +59,26 @@ class Employee:
         self.entries_df = self.entries_df[self.entries_df["Status"] != status]
 
         # Convert the pivoted table into long-form records
+        # Zero hours are not stored, except one row that keeps a project without hours
         new_rows = []
         for _, row in df.iterrows():
             project = row.get("Project") or row.get("Type", "")
+            project_rows = []
             for week in weeks:
                 hours = row.get(week)
-                if pd.isna(hours):
+                if pd.isna(hours) or float(hours) == 0:
                     continue
+                project_rows.append((week, float(hours)))
+            if not project_rows and weeks:
+                project_rows.append((weeks[0], 0.0))
+            for week, hours in project_rows:
                 new_rows.append(
                     {
                         "Name": self.name,
                         "Row": row.name,
                         "Project": project,
                         "Week": week,
-                        "Hours": float(hours),
+                        "Hours": hours,
                         "Status": status,
                     }
                 )
@@ -0,0 +1,155 @@
+"""
+Bulk onboarding of employees from a roster file.
+
+A roster is a CSV with the columns Name, Office, WeeklyHours and optionally
+Team. All new employees, their default leave/BD rows and their default skills
+are built in one vectorized pass and each data file is written once.
+
+Usage:
+    python onboarding.py roster.csv
+"""
+
+import argparse
+
+import pandas as pd
+
+from snapshots import ENTRY_SNAPSHOTS, SKILL_SNAPSHOTS
+from utils import (
+    EMPLOYEES_COLUMNS,
+    EMPLOYEES_FILE,
+    ENTRIES_COLUMNS,
+    ENTRIES_FILE,
+    SKILLS_COLUMNS,
+    SKILLS_FILE,
+    SKILLS_TEMPLATE_FILE,
+    default_week_strs,
+    load_csv,
+    save_csv,
+)
+
+OFFICES = ["UK", "France", "Switzerland", "Other"]
+DEFAULT_LEAVE_TYPES = ["Vacation", "Holiday", "Sick Leave"]
+DEFAULT_BD_TYPES = ["Proposal", "Training", "Technical Development", "Conference"]
+DEFAULT_WEEKLY_HOURS = 40.0
+
+
+def clean_roster(roster):
+    """
+    Validates a roster and normalises its values.
+
+    Parameters:
+        roster (pd.DataFrame): Must contain a 'Name' column. 'Office' and 'WeeklyHours'
+                               are optional and default to "Other" and 40 hours;
+                               'Team' is optional and left empty.
+
+    Returns:
+        pd.DataFrame: Roster with stripped, unique, non-empty names.
+    """
+    if "Name" not in roster.columns:
+        raise ValueError("Roster must have a 'Name' column.")
+
+    roster = roster.reindex(columns=EMPLOYEES_COLUMNS).copy()
+    roster["Name"] = roster["Name"].astype("string").str.strip()
+    roster = roster[roster["Name"].notna() & (roster["Name"] != "")]
+    roster["Office"] = roster["Office"].fillna("Other")
+    roster["WeeklyHours"] = (
+        pd.to_numeric(roster["WeeklyHours"], errors="coerce")
+        .fillna(DEFAULT_WEEKLY_HOURS)
+        .astype(float)
+    )
+    return roster.drop_duplicates(subset="Name").reset_index(drop=True)
+
+
+def build_onboarding(roster, week_strs, skills_template):
+    """
+    Builds the employee, entry and skill rows for a cleaned roster.
+
+    Parameters:
+        roster (pd.DataFrame): Cleaned roster (see `clean_roster`).
+        week_strs (list[str]): Visible weeks; the default leave and BD rows are placed in
+                               the first one.
+        skills_template (pd.DataFrame): Template with 'Category' and 'Skill' columns.
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]: New employees, entries and skills.
+    """
+    names = roster[["Name"]]
+
+    default_types = pd.concat(
+        [
+            pd.DataFrame({"Project": DEFAULT_LEAVE_TYPES, "Status": "Leave"}),
+            pd.DataFrame({"Project": DEFAULT_BD_TYPES, "Status": "BD"}),
+        ],
+        ignore_index=True,
+    )
+    default_types["Row"] = default_types.groupby("Status").cumcount()
+    # One zero-hour placeholder per project, as `Employee.save_entries` and compaction store it
+    entries = names.merge(default_types, how="cross")
+    entries["Week"] = week_strs[0]
+    entries["Hours"] = 0.0
+
+    skills = names.merge(skills_template[["Category", "Skill"]], how="cross")
+    skills["Level"] = ""
+    skills["LastUpdated"] = ""
+
+    return roster[EMPLOYEES_COLUMNS], entries[ENTRIES_COLUMNS], skills[SKILLS_COLUMNS]
+
+
+def onboard_employees(roster, week_strs=None):
+    """
+    Adds every employee of the roster that does not exist yet.
+
+    Each data file is read and written once, however many people are onboarded.
+
+    Parameters:
+        roster (pd.DataFrame): Roster with Name, Office, WeeklyHours and optional Team.
+        week_strs (list[str], optional): Visible weeks, defaults to the next 12 weeks.
+
+    Returns:
+        tuple[list[str], list[str]]: Names added and names skipped because they already exist.
+    """
+    if week_strs is None:
+        week_strs = default_week_strs()
+
+    roster = clean_roster(roster)
+    df_employees = load_csv(EMPLOYEES_FILE, EMPLOYEES_COLUMNS)
+    exists = roster["Name"].isin(df_employees["Name"].dropna())
+    skipped = roster.loc[exists, "Name"].tolist()
+    roster = roster[~exists]
+    if roster.empty:
+        return [], skipped
+
+    new_employees, new_entries, new_skills = build_onboarding(
+        roster, week_strs, load_csv(SKILLS_TEMPLATE_FILE, ["Category", "Skill"])
+    )
+
+    df_entries = load_csv(ENTRIES_FILE, ENTRIES_COLUMNS)
+    df_skills = load_csv(SKILLS_FILE, SKILLS_COLUMNS)
+    ENTRY_SNAPSHOTS.ensure_baseline(df_entries)
+    SKILL_SNAPSHOTS.ensure_baseline(df_skills)
+
+    save_csv(pd.concat([df_employees, new_employees], ignore_index=True), EMPLOYEES_FILE)
+    df_entries = pd.concat([df_entries, new_entries], ignore_index=True)
+    save_csv(df_entries, ENTRIES_FILE)
+    ENTRY_SNAPSHOTS.record(df_entries)
+    df_skills = pd.concat([df_skills, new_skills], ignore_index=True)
+    save_csv(df_skills, SKILLS_FILE)
+    SKILL_SNAPSHOTS.record(df_skills)
+    return roster["Name"].tolist(), skipped
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Onboard employees from a roster CSV.")
+    parser.add_argument(
+        "roster", help="CSV with Name, Office, WeeklyHours and optional Team columns"
+    )
+    args = parser.parse_args()
+
+    added, skipped = onboard_employees(pd.read_csv(args.roster))
+    print(f"➕ Onboarded {len(added)} employees")
+    if skipped:
+        print(f"⏭️ Skipped {len(skipped)} existing employees: {', '.join(skipped)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+Background prefetch of the employee views the user is likely to open next.
+
+An `EmployeeView` holds everything the Time Planner and Dashboard tabs compute
+for one employee and week window: the `Employee`, the four status pivots and
+the status/percentage charts, which are built on first use. After a render the
+app asks the `Prefetcher` to build the views of the previous and next employee in the sorted list, and of
+the current employee with the week window moved one week either way. Views are
+built on a small thread pool and kept in a bounded LRU keyed by
+(name, week dates, data version), so a change to any data file makes the old
+views unreachable and they age out.
+
+PREFETCH_CACHE_SIZE (default 32) caps the number of views kept and
+PREFETCH_WORKERS (default 2, 0 disables prefetching) sizes the pool.
+"""
+
+import copy
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import cached_property
+
+from charts import percentage_chart, status_chart, weekly_status_totals
+from models import Employee
+from utils import STATUSES, pivot_entries
+
+PREFETCH_CACHE_SIZE = int(os.environ.get("PREFETCH_CACHE_SIZE", "32"))
+PREFETCH_WORKERS = int(os.environ.get("PREFETCH_WORKERS", "2"))
+
+
+class EmployeeView:
+    """
+    Pivots and chart data of one employee for one week window.
+    Attributes:
+        employee (Employee): The employee, built from the full data frames.
+        week_strs (list[str]): Week columns of the window.
+        pivots (dict[str, pd.DataFrame]): Project x week hours per status.
+        capacity (list[float]): Available hours per week after public holidays.
+        df_grouped (pd.DataFrame | None): Weekly totals per status, None without hours.
+        status_chart, percentage_chart (alt.Chart | None): Dashboard charts, None without
+            hours. Built on first access, so altair is not imported before the first render.
+    """
+
+    def __init__(self, name, week_dates, entries_df, skills_df, employees_df):
+        self.employee = Employee(name, entries_df, skills_df, employees_df)
+        self.week_strs = [week.strftime("%d-%b") for week in week_dates]
+        self.pivots = {
+            status: pivot_entries(self.employee.entries_df, status, self.week_strs)
+            for status in STATUSES
+        }
+        self.capacity = self.employee.available_hours(week_dates)
+
+        self.df_grouped = None
+        if self.employee.entries_df["Hours"].sum() > 0:
+            self.df_grouped = weekly_status_totals(self.employee.entries_df, self.week_strs)
+
+    @cached_property
+    def status_chart(self):
+        if self.df_grouped is None:
+            return None
+        return status_chart(self.df_grouped, self.week_strs, self.capacity)
+
+    @cached_property
+    def percentage_chart(self):
+        if self.df_grouped is None:
+            return None
+        return percentage_chart(self.df_grouped, self.week_strs, self.capacity)
+
+    def build_charts(self):
+        return self.status_chart, self.percentage_chart
+
+
+class Prefetcher:
+    """
+    Bounded LRU of employee views, filled on demand and by background prefetches.
+    Methods:
+        get(name, week_dates, version, frames):
+            Returns the view, waiting for a running prefetch or building it if needed.
+        prefetch(requests, version, frames):
+            Schedules the views that are neither cached nor being built.
+    """
+
+    def __init__(self, max_views=PREFETCH_CACHE_SIZE, workers=PREFETCH_WORKERS):
+        self.max_views = max_views
+        self._lock = threading.Lock()
+        self._views = OrderedDict()
+        self._pending = {}
+        self._pool = (
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prefetch")
+            if workers > 0
+            else None
+        )
+
+    @staticmethod
+    def _key(name, week_dates, version):
+        return name, tuple(week_dates), version
+
+    def _store(self, key, view):
+        with self._lock:
+            self._views[key] = view
+            self._views.move_to_end(key)
+            while len(self._views) > self.max_views:
+                self._views.popitem(last=False)
+            self._pending.pop(key, None)
+
+    def _build(self, key, frames, charts=False):
+        name, week_dates, _ = key
+        try:
+            view = EmployeeView(name, list(week_dates), *frames)
+            if charts:
+                view.build_charts()
+        except Exception as e:
+            with self._lock:
+                self._pending.pop(key, None)
+            print(f"⚠️ Prefetch of {name} failed: {e}")
+            raise
+        self._store(key, view)
+        return view
+
+    def _handout(self, view):
+        # Callbacks reassign the employee's frames, so every caller gets its own object
+        view = copy.copy(view)
+        view.employee = copy.copy(view.employee)
+        return view
+
+    def get(self, name, week_dates, version, frames):
+        """
+        Returns the view of an employee and week window.
+
+        Args:
+            name (str): Employee name.
+            week_dates (list[date]): Mondays of the window.
+            version (tuple): Modification times of the data files the frames were read from.
+            frames (tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]): Entries, skills, employees.
+
+        Returns:
+            EmployeeView: Shallow copy of the cached view.
+        """
+        key = self._key(name, week_dates, version)
+        with self._lock:
+            view = self._views.get(key)
+            if view is not None:
+                self._views.move_to_end(key)
+                return self._handout(view)
+            future = self._pending.get(key)
+
+        if future is not None:
+            try:
+                return self._handout(future.result())
+            except Exception:
+                pass  # Build it here and let any error surface to the caller
+        return self._handout(self._build(key, frames))
+
+    def prefetch(self, requests, version, frames):
+        """
+        Builds the views of (name, week_dates) requests in the background.
+        """
+        if self._pool is None:
+            return
+        for name, week_dates in requests:
+            key = self._key(name, week_dates, version)
+            with self._lock:
+                if key in self._views or key in self._pending:
+                    continue
+                # Prefetches run after the render, so they can build the charts too
+                self._pending[key] = self._pool.submit(self._build, key, frames, True)
+
+
+def neighbour_requests(employees, selected, week_dates):
+    """
+    The previous and next employee in the list with the current window, and the
+    current employee with the window moved one week back and forward.
+
+    Returns:
+        list[tuple[str, list[date]]]: (name, week_dates) requests, nearest first.
+    """
+    requests = []
+    if selected in employees:
+        index = employees.index(selected)
+        for neighbour in (index + 1, index - 1):
+            if 0 <= neighbour < len(employees) and employees[neighbour] != selected:
+                requests.append((employees[neighbour], week_dates))
+    for shift in (1, -1):
+        requests.append(
+            (selected, [week + timedelta(weeks=shift) for week in week_dates])
+        )
+    return requests
@@ -0,0 +1,53 @@
+"""
+Warms up the running app in the background once its first render is done.
+
+The first render does not import altair (charts are only built in open
+expanders) and parses each data file once. After that render `start_prewarm`
+imports altair and fills the parsed-data caches in `data/.cache` on a daemon
+thread inside the Streamlit process, so the first chart a user opens is fast
+and the next process start skips the CSV parses. The time taken is appended to
+`data/startup_times.csv` next to the first-render times.
+
+Usage:
+    python prewarm.py      # only fill the parsed-data caches, e.g. after replacing the data files
+"""
+
+import os
+import threading
+import time
+
+from utils import CACHED_FILES, log_startup_time, read_csv_cached
+
+
+def prewarm(import_charts=True):
+    start = time.perf_counter()
+
+    if import_charts:
+        import altair  # noqa: F401
+
+    imported = time.perf_counter()
+
+    for file in CACHED_FILES:
+        if os.path.exists(file):
+            read_csv_cached(file)
+
+    done = time.perf_counter()
+    print(
+        f"🔥 Prewarmed in {done - start:.2f}s "
+        f"(imports {imported - start:.2f}s, data {done - imported:.2f}s)"
+    )
+    log_startup_time("prewarm", done - start)
+
+
+def start_prewarm():
+    thread = threading.Thread(target=prewarm, name="prewarm", daemon=True)
+    thread.start()
+    return thread
+
+
+def main():
+    prewarm(import_charts=False)
+
+
+if __name__ == "__main__":
+    main()
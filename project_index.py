@@ -0,0 +1,124 @@
+import pandas as pd
+
+PROJECT_STATUSES = ["Confirmed", "Tentative"]
+INDEX_COLUMNS = ["Name", "Week", "Hours", "Status"]
+
+
+class ProjectIndex:
+    """
+    Project-centric index over the entries store.
+
+    Keeps, for every Confirmed or Tentative project, the slice of entries booked
+    against it, so cross-employee project views never scan the full entries table.
+    Attributes:
+        projects (dict[str, pd.DataFrame]): Project -> entries with Name, Week, Hours, Status.
+        employee_projects (dict[str, set[str]]): Name -> projects the employee has entries on.
+        mtime (float | None): Modification time of the entries file the index reflects.
+    Methods:
+        update_employee(name, employee_df):
+            Replaces one employee's slices after their entries were saved.
+        project_hours(project, status, weeks):
+            Employee x week hours for one project and status, with totals.
+        status_totals(project, weeks):
+            Weekly Confirmed and Tentative totals for one project.
+    """
+
+    def __init__(self, entries_df, mtime=None):
+        self.mtime = mtime
+        self.projects = {}
+        self.employee_projects = {}
+        self._add(entries_df)
+
+    def _add(self, entries_df):
+        entries_df = entries_df[entries_df["Status"].isin(PROJECT_STATUSES)]
+        entries_df = entries_df.dropna(subset=["Name", "Project"])
+        for project, project_df in entries_df.groupby("Project", sort=False):
+            project_df = project_df[INDEX_COLUMNS]
+            if project in self.projects:
+                project_df = pd.concat(
+                    [self.projects[project], project_df], ignore_index=True
+                )
+            self.projects[project] = project_df.reset_index(drop=True)
+        for name, projects in entries_df.groupby("Name")["Project"].unique().items():
+            self.employee_projects.setdefault(name, set()).update(projects)
+
+    def update_employee(self, name, employee_df):
+        """
+        Replaces the slices of one employee with their saved entries.
+
+        Only the projects the employee was or is now booked on are touched.
+
+        Args:
+            name (str): Employee name.
+            employee_df (pd.DataFrame): All entries of the employee after the save.
+        """
+        for project in self.employee_projects.pop(name, set()):
+            project_df = self.projects.get(project)
+            if project_df is None:
+                continue
+            project_df = project_df[project_df["Name"] != name]
+            if project_df.empty:
+                del self.projects[project]
+            else:
+                self.projects[project] = project_df
+        self._add(employee_df)
+
+    def project_names(self):
+        return sorted(self.projects, key=str)
+
+    def project_hours(self, project, status, weeks):
+        """
+        Pivots one project's hours for a status into employee rows and week columns.
+
+        Args:
+            project (str): Project name.
+            status (str): 'Confirmed' or 'Tentative'.
+            weeks (list[str]): Week strings to show, in display order.
+
+        Returns:
+            pd.DataFrame: 'Name' plus one column per week and a 'Total' column, with a
+                          final 'Total' row. Empty if nobody booked the project.
+        """
+        project_df = self.projects.get(project)
+        if project_df is None:
+            return pd.DataFrame(columns=["Name"] + weeks + ["Total"])
+        filtered = project_df[
+            (project_df["Status"] == status) & project_df["Week"].isin(weeks)
+        ]
+        if filtered.empty:
+            return pd.DataFrame(columns=["Name"] + weeks + ["Total"])
+
+        pivot = (
+            filtered.pivot_table(
+                index="Name", columns="Week", values="Hours", aggfunc="sum"
+            )
+            .reindex(columns=weeks)
+            .fillna(0)
+        )
+        pivot = pivot[pivot.sum(axis=1) > 0]
+        if pivot.empty:
+            return pd.DataFrame(columns=["Name"] + weeks + ["Total"])
+        pivot.loc["Total"] = pivot.sum()
+        pivot["Total"] = pivot.sum(axis=1)
+        pivot.columns.name = None
+        return pivot.rename_axis("Name").reset_index()
+
+    def status_totals(self, project, weeks):
+        """
+        Returns the weekly total hours of a project per status.
+
+        Returns:
+            pd.DataFrame: 'Status' rows for Confirmed and Tentative, week columns and 'Total'.
+        """
+        project_df = self.projects.get(project, pd.DataFrame(columns=INDEX_COLUMNS))
+        filtered = project_df[project_df["Week"].isin(weeks)]
+        totals = (
+            filtered.groupby(["Status", "Week"])["Hours"]
+            .sum()
+            .unstack(fill_value=0)
+            .reindex(index=PROJECT_STATUSES, columns=weeks)
+            .fillna(0)
+        )
+        totals["Total"] = totals.sum(axis=1)
+        totals.columns.name = None
+        return totals.rename_axis("Status").reset_index()
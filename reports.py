@@ -0,0 +1,204 @@
+"""
+Batch utilization reports for every employee.
+
+Renders each employee's status chart, percentage chart and weekly summary
+table (the same aggregation as the Dashboard tab) to files, fanned out over
+a process pool. Every worker receives the data once when it starts and only
+reads it afterwards.
+
+Output layout:
+    reports/<YYYY-MM>/<Name>/status.html|png
+    reports/<YYYY-MM>/<Name>/percentage.html|png
+    reports/<YYYY-MM>/<Name>/summary.csv
+    reports/<YYYY-MM>/summary.csv          utilization of everyone, one row per employee
+
+Usage:
+    python reports.py                       # current month, HTML and CSV, all cores
+    python reports.py --month 2026-09 --formats html,png,csv --workers 8
+
+PNG export needs the optional `vl-convert-python` package.
+"""
+
+import argparse
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+import pandas as pd
+
+from charts import percentage_chart, status_chart, weekly_status_totals
+from models import Employee
+from utils import (
+    EMPLOYEES_COLUMNS,
+    EMPLOYEES_FILE,
+    ENTRIES_COLUMNS,
+    ENTRIES_FILE,
+    SKILLS_COLUMNS,
+    STATUSES,
+    load_csv,
+)
+
+REPORTS_DIR = "reports"
+FORMATS = ["html", "png", "csv"]
+
+# Read-only data of a worker process, set once by `_init_worker`
+_worker_data = {}
+
+
+def month_week_dates(month):
+    """
+    Mondays of the weeks starting in a month ("YYYY-MM").
+    """
+    start = pd.Period(month, freq="M").start_time
+    first_monday = start + pd.Timedelta(days=(7 - start.weekday()) % 7)
+    end = pd.Period(month, freq="M").end_time
+    return [d.date() for d in pd.date_range(first_monday, end, freq="7D")]
+
+
+def summary_table(entries_df, week_strs, capacity):
+    """
+    Weekly hours per status with totals, available hours and utilization.
+
+    Returns:
+        pd.DataFrame: One row per status plus 'Total', 'Available' and 'Utilization %',
+                      one column per week.
+    """
+    totals = (
+        weekly_status_totals(entries_df, week_strs)
+        .pivot_table(
+            index="Status", columns="Week", values="Hours", aggfunc="sum", observed=False
+        )
+        .reindex(index=STATUSES, columns=week_strs)
+        .fillna(0)
+    )
+    totals.columns = totals.columns.astype(str)
+    available = pd.Series(capacity, index=week_strs, dtype=float)
+    totals.loc["Total"] = totals.loc[STATUSES].sum()
+    totals.loc["Available"] = available
+    totals.loc["Utilization %"] = (
+        totals.loc["Total"] / available.replace(0, float("nan")) * 100
+    ).round(1)
+    return totals.rename_axis("Type").reset_index()
+
+
+def safe_filename(name):
+    return re.sub(r"[^\w\-]+", "_", str(name)).strip("_") or "employee"
+
+
+def _init_worker(entries_df, employees_df):
+    _worker_data["entries"] = entries_df
+    _worker_data["employees"] = employees_df
+    _worker_data["skills"] = pd.DataFrame(columns=SKILLS_COLUMNS)
+
+
+def render_employee_report(name, week_dates, out_dir, formats):
+    """
+    Writes one employee's charts and summary table.
+
+    Runs in a worker process and reads the data set up by `_init_worker`.
+
+    Returns:
+        tuple[str, pd.Series, list[str]]: Name, utilization per week and any warnings.
+    """
+    employee = Employee(
+        name, _worker_data["entries"], _worker_data["skills"], _worker_data["employees"]
+    )
+    week_strs = [week.strftime("%d-%b") for week in week_dates]
+    capacity = employee.available_hours(week_dates)
+    employee_dir = os.path.join(out_dir, safe_filename(name))
+    os.makedirs(employee_dir, exist_ok=True)
+    warnings = []
+
+    summary = summary_table(employee.entries_df, week_strs, capacity)
+    if "csv" in formats:
+        summary.to_csv(os.path.join(employee_dir, "summary.csv"), index=False)
+
+    chart_formats = [fmt for fmt in formats if fmt in ("html", "png")]
+    if chart_formats and employee.entries_df["Hours"].sum() > 0:
+        df_grouped = weekly_status_totals(employee.entries_df, week_strs)
+        charts = {
+            "status": status_chart(df_grouped, week_strs, capacity),
+            "percentage": percentage_chart(df_grouped, week_strs, capacity),
+        }
+        for chart_name, chart in charts.items():
+            for fmt in chart_formats:
+                try:
+                    chart.save(os.path.join(employee_dir, f"{chart_name}.{fmt}"))
+                except ValueError as e:
+                    # PNG export needs vl-convert-python
+                    warnings.append(f"{name}: could not save {chart_name}.{fmt} ({e})")
+
+    utilization = summary.set_index("Type").loc["Utilization %"]
+    return name, utilization, warnings
+
+
+def generate_reports(month=None, formats=("html", "csv"), workers=None, out_dir=None):
+    """
+    Renders reports for every employee in parallel.
+
+    Parameters:
+        month (str, optional): "YYYY-MM", defaults to the current month.
+        formats (tuple[str]): Any of "html", "png" and "csv".
+        workers (int, optional): Worker processes, defaults to the number of cores.
+        out_dir (str, optional): Output folder, defaults to `reports/<month>`.
+
+    Returns:
+        tuple[pd.DataFrame, list[str]]: Utilization of every employee and warnings.
+    """
+    month = month or date.today().strftime("%Y-%m")
+    out_dir = out_dir or os.path.join(REPORTS_DIR, month)
+    week_dates = month_week_dates(month)
+    entries_df = load_csv(ENTRIES_FILE, ENTRIES_COLUMNS)
+    employees_df = load_csv(EMPLOYEES_FILE, EMPLOYEES_COLUMNS)
+    names = sorted(employees_df["Name"].dropna().unique())
+    os.makedirs(out_dir, exist_ok=True)
+
+    rows, warnings = {}, []
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(entries_df, employees_df),
+    ) as pool:
+        futures = [
+            pool.submit(render_employee_report, name, week_dates, out_dir, formats)
+            for name in names
+        ]
+        for future in futures:
+            name, utilization, employee_warnings = future.result()
+            rows[name] = utilization
+            warnings.extend(employee_warnings)
+
+    company = pd.DataFrame.from_dict(rows, orient="index").rename_axis("Name")
+    if "csv" in formats:
+        company.to_csv(os.path.join(out_dir, "summary.csv"))
+    return company, warnings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render utilization reports for all employees.")
+    parser.add_argument("--month", help="Month to report as YYYY-MM (default: current month)")
+    parser.add_argument(
+        "--formats",
+        default="html,csv",
+        help=f"Comma-separated output formats from {FORMATS}",
+    )
+    parser.add_argument("--workers", type=int, help="Worker processes (default: all cores)")
+    parser.add_argument("--out", help="Output folder (default: reports/<month>)")
+    args = parser.parse_args()
+
+    formats = tuple(fmt.strip() for fmt in args.formats.split(",") if fmt.strip())
+    unknown = set(formats) - set(FORMATS)
+    if unknown:
+        parser.error(f"Unknown formats: {', '.join(sorted(unknown))}")
+
+    start = time.perf_counter()
+    company, warnings = generate_reports(args.month, formats, args.workers, args.out)
+    for warning in warnings:
+        print(f"⚠️ {warning}")
+    print(f"📄 Rendered {len(company)} reports in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
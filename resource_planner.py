@@ -1,36 +1,66 @@
+import time
+
+_script_start = time.perf_counter()
+
 import streamlit as st
 import pandas as pd
 from datetime import date, timedelta
 import os
 from utils import *
-from models import Employee
-import numpy as np
-import altair as alt
+from charts import heatmap_chart, heatmap_matrix
+from alerts import ALERT_SCAN_INTERVAL, AlertScanner, load_alerts
+from calendars import capacity_matrix
+from compaction import AUTO_COMPACT, compact_file_if_needed
+from onboarding import OFFICES, onboard_employees
+from prefetch import Prefetcher, neighbour_requests
+from prewarm import start_prewarm
+from project_index import PROJECT_STATUSES, ProjectIndex
+from rollups import RollupCache
+from snapshots import ENTRY_SNAPSHOTS, SKILL_SNAPSHOTS
 
 # ---- Initialize App ----
 st.set_page_config(page_title="Resource Planner", layout="wide")
 
-# ---- CONSTANTS ----
-ENTRIES_FILE = "data/entries.csv"
-SKILLS_FILE = "data/skills.csv"
-EMPLOYEES_FILE = "data/employees.csv"
-DEFAULT_LEAVE_TYPES = ["Vacation", "Holiday", "Sick Leave"]
-DEFAULT_BD_TYPES = ["Proposal", "Training", "Technical Development", "Conference"]
+# ---- Background Alert Scan ----
+@st.cache_resource
+def start_alert_scanner():
+    # One scanner per server process, shared by all sessions
+    return AlertScanner(ALERT_SCAN_INTERVAL).start()
+
+
+if ALERT_SCAN_INTERVAL > 0:
+    start_alert_scanner()
+
+# ---- Employee View Prefetch ----
+@st.cache_resource
+def get_prefetcher():
+    # Views are keyed by data version, so all sessions can share them
+    return Prefetcher()
+
+
+# ---- Background Warm-up ----
+@st.cache_resource
+def start_background_prewarm():
+    # Once per server process, after its first render has been timed
+    return start_prewarm()
+
 
 # ---- Cached Data Load ----
 # @st.cache_data
 def load_all_data():
+    if AUTO_COMPACT:
+        compact_file_if_needed(ENTRIES_FILE)
     return (
-        load_csv(ENTRIES_FILE, ["Name", "Row", "Week", "Project", "Hours", "Status"]),
-        load_csv(SKILLS_FILE, ["Name", "Category", "Skill", "Level", "LastUpdated"]),
-        load_csv(EMPLOYEES_FILE, ["Name", "Office", "WeeklyHours"]),
+        load_csv(ENTRIES_FILE, ENTRIES_COLUMNS),
+        load_csv(SKILLS_FILE, SKILLS_COLUMNS),
+        load_csv(EMPLOYEES_FILE, EMPLOYEES_COLUMNS),
     )
 
 
-def on_skills_change(key, category, employee, df_all_skills):
-    change = st.session_state[key]
-    print(f"\n🔄 Skill change detected in '{key}' (Category: {category}):")
-
+def apply_skills_change(change, category, employee, df_all_skills):
+    """
+    Applies a data_editor diff for one skill category and returns the updated skills table.
+    """
     updated_df = df_all_skills[
         (df_all_skills["Name"] == employee.name)
         & (df_all_skills["Category"] == category)
@@ -97,10 +127,90 @@ def on_skills_change(key, category, employee, df_all_skills):
             & (df_all_skills["Category"] == category)
         )
     ]
-    df_all_skills = pd.concat([df_all_skills, employee.skills_df], ignore_index=True)
+    return pd.concat([df_all_skills, employee.skills_df], ignore_index=True)
 
-    # Save to file
+
+def on_skills_change(key, category, employee, df_all_skills):
+    change = st.session_state[key]
+    print(f"\n🔄 Skill change detected in '{key}' (Category: {category}):")
+
+    # Keep the state before the first change as the baseline of the history
+    SKILL_SNAPSHOTS.ensure_baseline(df_all_skills)
+
+    df_all_skills = apply_skills_change(change, category, employee, df_all_skills)
+
+    # Save to file and record the change in the skills history
     save_csv(df_all_skills, SKILLS_FILE)
+    SKILL_SNAPSHOTS.record(df_all_skills)
+
+
+def on_skills_grid_change(key, grid_df, default_category, employee, df_all_skills):
+    """
+    Splits the diff of the consolidated skills grid into per-category diffs, applies
+    them like `on_skills_change` would and saves the skills file once.
+    """
+    change = st.session_state[key]
+    print(f"\n🔄 Skill change detected in '{key}':")
+
+    # Row position of each grid row within its category's own table
+    positions = grid_df.groupby("Category").cumcount()
+    category_changes = {}
+
+    def changes_for(category):
+        return category_changes.setdefault(
+            category, {"edited_rows": {}, "added_rows": [], "deleted_rows": []}
+        )
+
+    for row_idx, edits in change.get("edited_rows", {}).items():
+        row = grid_df.iloc[int(row_idx)]
+        position = int(positions.iloc[int(row_idx)])
+        edits = dict(edits)
+        new_category = edits.pop("Category", row["Category"])
+        if new_category == row["Category"]:
+            if edits:
+                changes_for(row["Category"])["edited_rows"][position] = edits
+        elif new_category:
+            # Moving a skill to another category removes it here and adds it there
+            changes_for(row["Category"])["deleted_rows"].append(position)
+            changes_for(new_category)["added_rows"].append(
+                {
+                    "Skill": edits.get("Skill", row["Skill"]),
+                    "Level": edits.get("Level", row["Level"]),
+                }
+            )
+
+    # In the "All" view a new row only has a category once the user picks one
+    skipped = 0
+    for row in change.get("added_rows", []):
+        category = row.get("Category") or default_category
+        if category:
+            changes_for(category)["added_rows"].append(row)
+        elif row.get("Skill"):
+            skipped += 1
+    if skipped:
+        st.session_state["skills_grid_skipped"] = skipped
+
+    for row_idx in change.get("deleted_rows", []):
+        row = grid_df.iloc[int(row_idx)]
+        changes_for(row["Category"])["deleted_rows"].append(
+            int(positions.iloc[int(row_idx)])
+        )
+
+    if not category_changes:
+        return
+
+    # Keep the state before the first change as the baseline of the history
+    SKILL_SNAPSHOTS.ensure_baseline(df_all_skills)
+
+    for category, category_change in category_changes.items():
+        print(f"Category: {category}")
+        df_all_skills = apply_skills_change(
+            category_change, category, employee, df_all_skills
+        )
+
+    # Save to file once and record the change in the skills history
+    save_csv(df_all_skills, SKILLS_FILE)
+    SKILL_SNAPSHOTS.record(df_all_skills)
 
 
 def on_table_change(key, original_df, weeks, status, employee, df_all_entries):
@@ -153,10 +263,26 @@ def on_table_change(key, original_df, weeks, status, employee, df_all_entries):
     # Save to employee
     employee_df = employee.save_entries(updated_df, status, weeks)
 
+    # Keep the state before the first change as the baseline of the history
+    ENTRY_SNAPSHOTS.ensure_baseline(df_all_entries)
+
     # Replace all current employee data in entries file
     df_all_entries = df_all_entries[df_all_entries["Name"] != employee.name]
     df_all_entries = pd.concat([df_all_entries, employee_df], ignore_index=True)
     save_csv(df_all_entries, ENTRIES_FILE)
+    ENTRY_SNAPSHOTS.record(df_all_entries)
+
+    # Keep the project index in step without rebuilding it
+    project_index = st.session_state.get("project_index")
+    if project_index is not None:
+        project_index.update_employee(employee.name, employee_df)
+        project_index.mtime = file_mtime(ENTRIES_FILE)
+
+    # Adjust the office/team totals by this employee's change only
+    rollups = st.session_state.get("rollups")
+    if rollups is not None:
+        rollups.update_person(employee.name, employee_df)
+        rollups.mtime = (file_mtime(ENTRIES_FILE), file_mtime(EMPLOYEES_FILE))
 
     # st.toast(f"{status} data updated.")
 
@@ -164,6 +290,26 @@ def on_table_change(key, original_df, weeks, status, employee, df_all_entries):
 # Load all data at the start
 df_all_entries, df_all_skills, df_all_employees = load_all_data()
 
+# Rebuild the project index only when the entries file changed elsewhere
+entries_mtime = file_mtime(ENTRIES_FILE)
+if (
+    "project_index" not in st.session_state
+    or st.session_state["project_index"].mtime != entries_mtime
+):
+    st.session_state["project_index"] = ProjectIndex(df_all_entries, entries_mtime)
+project_index = st.session_state["project_index"]
+
+# Office/team rollups also depend on who sits in which office and team
+rollups_mtime = (entries_mtime, file_mtime(EMPLOYEES_FILE))
+if (
+    "rollups" not in st.session_state
+    or st.session_state["rollups"].mtime != rollups_mtime
+):
+    st.session_state["rollups"] = RollupCache(
+        df_all_entries, df_all_employees, rollups_mtime
+    )
+rollups = st.session_state["rollups"]
+
 st.session_state["rerun_count"] = st.session_state.get("rerun_count", 0) + 1
 print(f"Rerun count: {st.session_state['rerun_count']}")
 
@@ -205,12 +351,32 @@ with st.sidebar:
     if "selected_employee" not in st.session_state:
         st.session_state["selected_employee"] = default_emp
 
+    ##########
+    # Alerts #
+    ##########
+    alerts = load_alerts()
+    if not alerts.empty:
+        alert_counts = alerts["Type"].value_counts()
+        st.warning(
+            "🚨 "
+            + ", ".join(
+                f"{count} {alert_type.replace('_', ' ')}"
+                for alert_type, count in alert_counts.items()
+            )
+        )
+        own_alerts = alerts[alerts["Name"] == selected]
+        if not own_alerts.empty:
+            with st.expander(f"Alerts for {selected}"):
+                st.dataframe(
+                    own_alerts.drop(columns="Name"), hide_index=True, use_container_width=True
+                )
+
     ##############
     # Week Range #
     ##############
     st.markdown("---")
     # st.subheader("Select week range to view")
-    base_monday = date.today() - timedelta(days=date.today().weekday())
+    base_monday = current_monday()
     min_weeks_back = 12
     max_weeks_forward = 20
 
@@ -223,12 +389,7 @@ with st.sidebar:
     )
     styled_subheader("0 = current week", size=12, margin=0, padding=3)
 
-    start_date = base_monday + timedelta(weeks=week_span[0])
-    end_date = base_monday + timedelta(weeks=week_span[1])
-    week_dates = [
-        start_date + timedelta(weeks=i)
-        for i in range((end_date - start_date).days // 7 + 1)
-    ]
+    week_dates = week_window(week_span[1] - week_span[0] + 1, start=week_span[0])
     week_strs = [w.strftime("%d-%b") for w in week_dates]
 
     st.session_state["week_range"] = week_span
@@ -252,7 +413,7 @@ with st.sidebar:
         new_emp = st.text_input("Enter new employee name", key="new_employee_input")
         office = st.selectbox(
             "Select office location",
-            options=["UK", "France", "Switzerland", "Other"],
+            options=OFFICES,
             key="new_employee_office",
         )
         weekly_hours = st.number_input(
@@ -261,6 +422,7 @@ with st.sidebar:
             step=0.5,
             value=40.0,
         )
+        team = st.text_input("Enter team (optional)", key="new_employee_team")
         col1, col2 = st.columns(2)
         if (
             col1.button("Submit", key="submit_new_emp")
@@ -269,88 +431,13 @@ with st.sidebar:
             and weekly_hours
         ):
             if new_emp not in employees:
-                df_employees = (
-                    pd.concat(
-                        [
-                            load_csv(EMPLOYEES_FILE, ["Name", "Office", "WeeklyHours"]),
-                            pd.DataFrame(
-                                [[new_emp, office, weekly_hours]],
-                                columns=["Name", "Office", "WeeklyHours"],
-                            ),
-                        ]
-                    )
-                    .drop_duplicates()
-                    .reset_index(drop=True)
-                )
-                save_csv(df_employees, EMPLOYEES_FILE)
-
-                # Add default leave and BD types for new employee
-                if "week_strs" in st.session_state:
-                    week_strs = st.session_state["week_strs"]
-                else:
-                    # Fallback (should rarely happen)
-                    base_monday = date.today() - timedelta(days=date.today().weekday())
-                    week_strs = [
-                        (base_monday + timedelta(weeks=i)).strftime("%d-%b")
-                        for i in range(12)
-                    ]
-
-                leave_rows = [
-                    {
-                        "Name": new_emp,
-                        "Row": i,
-                        "Week": week,
-                        "Project": leave,
-                        "Hours": 0,
-                        "Status": "Leave",
-                    }
-                    for i, leave in enumerate(DEFAULT_LEAVE_TYPES)
-                    for week in week_strs
-                ]
-                
-                bd_rows = [
-                    {
-                        "Name": new_emp,
-                        "Row": i,
-                        "Week": week,
-                        "Project": bd,
-                        "Hours": 0,
-                        "Status": "BD",
-                    }
-                    for i, bd in enumerate(DEFAULT_BD_TYPES)
-                    for week in week_strs
-                ]
-
-                df_entries = load_csv(
-                    ENTRIES_FILE, ["Name", "Week", "Project", "Hours", "Status"]
-                )
-                df_all = pd.concat(
-                    [df_entries, pd.DataFrame(leave_rows), pd.DataFrame(bd_rows)], ignore_index=True
-                )
-                save_csv(df_all, ENTRIES_FILE)
-                
-                # Add default skills for new employee
-                skills_template = load_csv(
-                    "data/skills_template.csv", ["Category", "Skill"]
-                )
-                default_skills = [
-                    {
-                        "Name": new_emp,
-                        "Category": row["Category"],
-                        "Skill": row["Skill"],
-                        "Level": "",
-                        "LastUpdated": "",
-                    }
-                    for _, row in skills_template.iterrows()
-                ]
-
-                df_skills = load_csv(
-                    SKILLS_FILE, ["Name", "Category", "Skill", "Level", "LastUpdated"]
-                )
-                df_all_skills = pd.concat(
-                    [df_skills, pd.DataFrame(default_skills)], ignore_index=True
+                onboard_employees(
+                    pd.DataFrame(
+                        [[new_emp, office, weekly_hours, team or None]],
+                        columns=EMPLOYEES_COLUMNS,
+                    ),
+                    st.session_state.get("week_strs"),
                 )
-                save_csv(df_all_skills, SKILLS_FILE)
                 st.session_state.show_input = False
                 st.session_state.new_emp_to_select = new_emp
                 st.rerun()
@@ -360,7 +447,30 @@ with st.sidebar:
             st.session_state.show_input = False
             st.rerun()
 
-employee = Employee(selected, df_all_entries, df_all_skills, df_all_employees)
+    with st.expander("Bulk Onboarding", expanded=False):
+        roster_file = st.file_uploader(
+            "Roster CSV (Name, Office, WeeklyHours, Team)", type="csv", key="roster_file"
+        )
+        if roster_file is not None and st.button("Onboard", key="onboard_roster"):
+            try:
+                added, skipped = onboard_employees(
+                    pd.read_csv(roster_file), st.session_state.get("week_strs")
+                )
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                if skipped:
+                    st.warning(f"Already exist: {', '.join(skipped)}")
+                if added:
+                    st.session_state.new_emp_to_select = added[0]
+                    st.rerun()
+
+# Prefetched views are only reused while none of the data files changed
+data_version = (entries_mtime, file_mtime(SKILLS_FILE), file_mtime(EMPLOYEES_FILE))
+data_frames = (df_all_entries, df_all_skills, df_all_employees)
+prefetcher = get_prefetcher()
+view = prefetcher.get(selected, week_dates, data_version, data_frames)
+employee = view.employee
 ##########
 # HEADER #
 ##########
@@ -394,7 +504,7 @@ with st.container():
 
 # ---- Tabs ----
 # tabs = st.tabs(["📊 Utilization Dashboard", "📝 Submit Hours", "👥 Employee Skills"])
-tabs = st.tabs(["Time Planner", "Dashboard", "Skills"])
+tabs = st.tabs(["Time Planner", "Dashboard", "Skills", "Projects"])
 
 
 ######################
@@ -407,19 +517,13 @@ with tabs[0]:
     # TOTAL HOURS #
     ###############
     total_container = st.empty()
-    entry_dfs = [
-        pivot_entries(employee.entries_df, "Confirmed", st.session_state["week_strs"]),
-        pivot_entries(employee.entries_df, "Tentative", st.session_state["week_strs"]),
-        pivot_entries(employee.entries_df, "BD", st.session_state["week_strs"]),
-        pivot_entries(employee.entries_df, "Leave", st.session_state["week_strs"]),
-    ]
+    entry_dfs = list(view.pivots.values())
     non_empty_entry_dfs = [df for df in entry_dfs if not df.empty]
     if non_empty_entry_dfs:
         all_entries = pd.concat(non_empty_entry_dfs)
     else:
         all_entries = pd.DataFrame(
-            [np.zeros(len(st.session_state["week_strs"]))],
-            columns=st.session_state["week_strs"],
+            0.0, index=[0], columns=st.session_state["week_strs"]
         )
     total_by_week = all_entries[st.session_state["week_strs"]].sum().to_frame().T
     total_by_week.insert(0, "Type", " Total Hours")
@@ -454,9 +558,7 @@ with tabs[0]:
     # CONFIRMED PROJECTS #
     ######################
     styled_subheader("Confirmed Projects")
-    confirmed_df = pivot_entries(
-        employee.entries_df, "Confirmed", st.session_state["week_strs"]
-    )
+    confirmed_df = view.pivots["Confirmed"]
 
     st.data_editor(
         confirmed_df,
@@ -480,9 +582,7 @@ with tabs[0]:
     # TENTATIVE PROJECTS #
     ######################
     styled_subheader("Tentative Projects")
-    tentative_df = pivot_entries(
-        employee.entries_df, "Tentative", st.session_state["week_strs"]
-    )
+    tentative_df = view.pivots["Tentative"]
 
     st.data_editor(
         tentative_df,
@@ -506,9 +606,7 @@ with tabs[0]:
     # Buisiness Development #
     #########################
     styled_subheader("Buisiness Development")
-    bd_data = pivot_entries(
-        employee.entries_df, "BD", st.session_state["week_strs"]
-    )
+    bd_data = view.pivots["BD"]
     if "Project" in bd_data.columns:
         bd_data = bd_data.rename(columns={"Project": "Type"})
 
@@ -534,9 +632,7 @@ with tabs[0]:
     # Leave / Vacation #
     ####################
     styled_subheader("Leave / Holiday")
-    leave_data = pivot_entries(
-        employee.entries_df, "Leave", st.session_state["week_strs"]
-    )
+    leave_data = view.pivots["Leave"]
     if "Project" in leave_data.columns:
         leave_data = leave_data.rename(columns={"Project": "Type"})
 
@@ -563,164 +659,103 @@ with tabs[0]:
 ###################
 
 with tabs[1]:
-
-    with st.expander("Total Weekly Hours (by Status)", expanded=False):
+    # Chart expanders rerun when opened and only build their chart while open,
+    # so altair is not imported until a chart is shown
+    with st.expander(
+        "Total Weekly Hours (by Status)",
+        expanded=False,
+        key="status_chart_open",
+        on_change="rerun",
+    ) as status_expander:
         # st.subheader("Total Weekly Hours (by Status)")
 
-        df = employee.entries_df.copy()
-        if df["Hours"].sum() > 0:
-            # Group by week and status
-            df_grouped = df.groupby(["Week", "Status"])["Hours"].sum().reset_index()
-
-            # Convert Week to datetime for correct sorting
-            df_grouped["Week_dt"] = pd.to_datetime(df_grouped["Week"], format="%d-%b")
-            week_strs_sorted = sorted(
-                st.session_state["week_strs"],
-                key=lambda x: pd.to_datetime(x, format="%d-%b"),
-            )
-            df_grouped = df_grouped[df_grouped["Week"].isin(week_strs_sorted)].copy()
-            df_grouped["Week"] = pd.Categorical(
-                df_grouped["Week"], categories=week_strs_sorted, ordered=True
-            )
-            # Filter data to only include selected weeks
-            min_week = st.session_state["week_strs"][0]
-            max_week = st.session_state["week_strs"][-1]
-            df_grouped = df_grouped[
-                (df_grouped["Week"] >= min_week) & (df_grouped["Week"] <= max_week)
-            ]
-            # Base stacked bar chart
-            bar_chart = (
-                alt.Chart(df_grouped)
-                .mark_bar()
-                .encode(
-                    x=alt.X("Week:O", title="Week", sort=week_strs_sorted),
-                    y=alt.Y("Hours:Q", title="Total Hours", stack="zero"),
-                    color=alt.Color(
-                        "Status:N",
-                        title="Status",
-                        scale=alt.Scale(
-                            domain=["Confirmed", "Tentative", "BD", "Leave"],
-                            range=["#9dd6fa", "#f0c4f5", "#71f6cc", "#fae996"],
-                        ),
-                    ),
-                    tooltip=["Week", "Status", "Hours"],
-                )
-            )
-
-            # Horizontal rule at Weekly Hours
-            util_line = (
-                alt.Chart(pd.DataFrame({"y": [employee.weekly_hours]}))
-                .mark_rule(color="green", strokeDash=[4, 4])
-                .encode(y="y:Q")
-            )
-
-            # Combine
-            final_chart = (bar_chart + util_line).properties(
-                width=700,
-                height=400,
-            )
-
-            st.altair_chart(final_chart, use_container_width=True)
-        else:
-            st.info("No hours submitted yet..")
+        if status_expander.open:
+            if view.status_chart is not None:
+                st.altair_chart(view.status_chart, use_container_width=True)
+            else:
+                st.info("No hours submitted yet..")
 
     with st.expander(
-        "Weekly Hours (as Percentage of Total Weekly Hours)", expanded=False
-    ):
+        "Weekly Hours (as Percentage of Total Weekly Hours)",
+        expanded=False,
+        key="percentage_chart_open",
+        on_change="rerun",
+    ) as percentage_expander:
         # st.subheader("Weekly Hours as Percentage of Total Weekly Hours")
 
-        if df["Hours"].sum() > 0:
-            df_grouped["Percentage"] = df_grouped["Hours"] / employee.weekly_hours * 100
+        if percentage_expander.open:
+            if view.percentage_chart is not None:
+                st.altair_chart(view.percentage_chart, use_container_width=True)
+            else:
+                st.info("No hours submitted yet..")
 
-            percentage_chart = (
-                alt.Chart(df_grouped)
-                .mark_bar()
-                .encode(
-                    x=alt.X("Week:O", title="Week", sort=week_strs_sorted),
-                    y=alt.Y(
-                        "Percentage:Q", title="Percentage of Weekly Hours", stack="zero"
-                    ),
-                    color=alt.Color(
-                        "Status:N",
-                        title="Status",
-                        scale=alt.Scale(
-                            domain=["Confirmed", "Tentative", "BD", "Leave"],
-                            range=["#9dd6fa", "#f0c4f5", "#71f6cc", "#fae996"],
-                        ),
-                    ),
-                    tooltip=["Week", "Status", "Percentage"],
-                )
+    with st.expander(
+        "Heatmap of Weekly Hours for All Employees",
+        expanded=False,
+        key="heatmap_open",
+        on_change="rerun",
+    ) as heatmap_expander:
+        if heatmap_expander.open:
+            heatmap_data = heatmap_matrix(df_all_entries, st.session_state["week_strs"])
+            company_capacity = capacity_matrix(
+                df_all_employees,
+                st.session_state["week_dates"],
+                st.session_state["week_strs"],
             )
-
-            percentage_line = (
-                alt.Chart(pd.DataFrame({"y": [100]}))
-                .mark_rule(color="green", strokeDash=[4, 4])
-                .encode(y="y:Q")
+            max_hours = (
+                company_capacity.to_numpy().max() if not company_capacity.empty else 40
             )
-
-            final_percentage_chart = (percentage_chart + percentage_line).properties(
-                width=700,
-                height=400,
+            st.altair_chart(
+                heatmap_chart(heatmap_data, st.session_state["week_strs"], max_hours),
+                use_container_width=True,
             )
 
-            st.altair_chart(final_percentage_chart, use_container_width=True)
-        else:
-            st.info("No hours submitted yet..")
-
-    with st.expander("Heatmap of Weekly Hours for All Employees", expanded=False):
-        # Load all employee entries
-        all_entries = df_all_entries.copy()
-        all_entries = (
-            all_entries.groupby(["Name", "Week"], observed=False)["Hours"]
-            .sum()
-            .reset_index()
+    with st.expander("Utilization by Office and Team", expanded=False):
+        col1, col2 = st.columns(2)
+        rollup_office = col1.selectbox(
+            "Office", ["All offices"] + rollups.offices(), key="rollup_office"
         )
+        rollup_team = "All teams"
+        if rollup_office != "All offices":
+            rollup_team = col2.selectbox(
+                "Team", ["All teams"] + rollups.teams(rollup_office), key="rollup_team"
+            )
 
-        # Convert Week to datetime for sorting
-        all_entries["Week_dt"] = pd.to_datetime(all_entries["Week"], format="%d-%b")
-        week_strs_sorted = sorted(
+        rollup_hours, rollup_utilization = rollups.view(
             st.session_state["week_strs"],
-            key=lambda x: pd.to_datetime(x, format="%d-%b"),
+            st.session_state["week_dates"],
+            office=None if rollup_office == "All offices" else rollup_office,
+            team=None if rollup_team == "All teams" else rollup_team,
         )
-        all_entries["Week"] = pd.Categorical(
-            all_entries["Week"], categories=week_strs_sorted, ordered=True
+        styled_subheader("Utilization %", size=16, margin=0, padding=3)
+        st.dataframe(rollup_utilization, hide_index=True, use_container_width=True)
+        styled_subheader("Hours", size=16, margin=0, padding=3)
+        st.dataframe(rollup_hours, hide_index=True, use_container_width=True)
+
+    with st.expander("Plan Changes", expanded=False):
+        since = st.date_input(
+            "Show changes since",
+            value=base_monday - timedelta(weeks=1),
+            key="changes_since",
         )
-
-        # Ensure unique combinations of Name and Week by aggregating
-        all_entries = (
-            all_entries.groupby(["Name", "Week"], observed=True)["Hours"]
-            .sum()
-            .reset_index()
-        )
-
-        # Pivot data for heatmap
-        heatmap_data = all_entries.pivot(
-            index="Name", columns="Week", values="Hours"
-        ).fillna(0)
-
-        # Convert to long format for Altair
-        heatmap_long = heatmap_data.reset_index().melt(
-            id_vars="Name", var_name="Week", value_name="Hours"
+        only_employee = st.checkbox(
+            f"Only {employee.name}", value=True, key="changes_only_employee"
         )
+        # History starts at the baseline, so earlier dates diff against it
+        plan_changes = ENTRY_SNAPSHOTS.diff(max(ENTRY_SNAPSHOTS.snapshot_at(since), 1))
+        if only_employee:
+            plan_changes = plan_changes[plan_changes["Name"] == employee.name]
 
-        # Heatmap chart
-        heatmap_chart = (
-            alt.Chart(heatmap_long)
-            .mark_rect()
-            .encode(
-                x=alt.X("Week:O", title="Week", sort=week_strs_sorted),
-                y=alt.Y("Name:O", title="Employee"),
-                color=alt.Color(
-                    "Hours:Q",
-                    title="Hours",
-                    scale=alt.Scale(scheme="reds", domain=[0, 40]),
+        if plan_changes.empty:
+            st.info("No changes in this period..")
+        else:
+            st.dataframe(
+                plan_changes.rename(
+                    columns={"Hours_Before": "Before", "Hours_After": "After"}
                 ),
-                tooltip=["Name", "Week", "Hours"],
+                hide_index=True,
+                use_container_width=True,
             )
-            .properties(width=700, height=400)
-        )
-
-        st.altair_chart(heatmap_chart, use_container_width=True)
 
 ################
 # -- SKILLS -- #
@@ -735,44 +770,94 @@ with tabs[2]:
             # Get unique categories
             categories = sorted(emp_skills["Category"].unique())
 
-            cols = st.columns(2)
-
-            # Create a separate data_editor for each category
-            for idx, category in enumerate(categories):
-                col = cols[idx % 2]
-                with col:
-                    styled_subheader(category, size=20, margin=0, padding=5)
-                    category_skills = emp_skills[emp_skills["Category"] == category][
-                        ["Skill", "Level"]
-                    ]
+            single_grid = st.toggle(
+                "Single skills grid",
+                key="skills_single_grid",
+                help="Edit all categories in one table instead of one table per category",
+            )
 
-                    category_skills_clean = category_skills.copy().reset_index(
-                        drop=True
+            if single_grid:
+                category_filter = st.selectbox(
+                    "Show category",
+                    ["All"] + categories,
+                    key="skills_grid_category",
+                )
+                grid_df = emp_skills[["Category", "Skill", "Level"]]
+                if category_filter != "All":
+                    grid_df = grid_df[grid_df["Category"] == category_filter]
+                grid_df = grid_df.reset_index(drop=True)
+                grid_df["Level"] = grid_df["Level"].astype(str)
+
+                skipped = st.session_state.pop("skills_grid_skipped", 0)
+                if skipped:
+                    st.error(
+                        f"{skipped} new skill(s) without a Category were not saved. "
+                        "Pick a Category for each new row."
                     )
-                    category_skills_clean.index.name = None
-                    category_skills_clean["Level"] = category_skills_clean[
-                        "Level"
-                    ].astype(str)
-                    st.data_editor(
-                        category_skills_clean,
-                        column_config={
-                            "Skill": st.column_config.TextColumn(),
-                            "Level": st.column_config.SelectboxColumn(
-                                options=["Beginner", "Intermediate", "Expert"]
-                            ),
-                        },
-                        num_rows="dynamic",
-                        key=f"skills_editor_{category}",
-                        hide_index=True,
-                        use_container_width=True,
-                        on_change=on_skills_change,
-                        args=(
-                            f"skills_editor_{category}",
-                            category,
-                            employee,
-                            df_all_skills,
+
+                st.data_editor(
+                    grid_df,
+                    column_config={
+                        "Category": st.column_config.SelectboxColumn(
+                            options=categories
                         ),
-                    )
+                        "Skill": st.column_config.TextColumn(),
+                        "Level": st.column_config.SelectboxColumn(
+                            options=["Beginner", "Intermediate", "Expert"]
+                        ),
+                    },
+                    num_rows="dynamic",
+                    key="skills_grid",
+                    hide_index=True,
+                    use_container_width=True,
+                    on_change=on_skills_grid_change,
+                    args=(
+                        "skills_grid",
+                        grid_df,
+                        None if category_filter == "All" else category_filter,
+                        employee,
+                        df_all_skills,
+                    ),
+                )
+            else:
+                cols = st.columns(2)
+
+                # Create a separate data_editor for each category
+                for idx, category in enumerate(categories):
+                    col = cols[idx % 2]
+                    with col:
+                        styled_subheader(category, size=20, margin=0, padding=5)
+                        category_skills = emp_skills[
+                            emp_skills["Category"] == category
+                        ][["Skill", "Level"]]
+
+                        category_skills_clean = category_skills.copy().reset_index(
+                            drop=True
+                        )
+                        category_skills_clean.index.name = None
+                        category_skills_clean["Level"] = category_skills_clean[
+                            "Level"
+                        ].astype(str)
+                        st.data_editor(
+                            category_skills_clean,
+                            column_config={
+                                "Skill": st.column_config.TextColumn(),
+                                "Level": st.column_config.SelectboxColumn(
+                                    options=["Beginner", "Intermediate", "Expert"]
+                                ),
+                            },
+                            num_rows="dynamic",
+                            key=f"skills_editor_{category}",
+                            hide_index=True,
+                            use_container_width=True,
+                            on_change=on_skills_change,
+                            args=(
+                                f"skills_editor_{category}",
+                                category,
+                                employee,
+                                df_all_skills,
+                            ),
+                        )
         else:
             st.info("No skills submitted yet..")
 
@@ -791,3 +876,40 @@ with tabs[2]:
             filtered.sort_values(by=["Skill", "Level"]),
             hide_index=True,
         )
+
+##################
+# -- PROJECTS -- #
+##################
+with tabs[3]:
+    project_names = project_index.project_names()
+    if project_names:
+        project = st.selectbox("Select project", project_names, key="selected_project")
+
+        styled_subheader("Total Hours", size=20, margin=0, padding=5)
+        st.dataframe(
+            project_index.status_totals(project, st.session_state["week_strs"]),
+            hide_index=True,
+            use_container_width=True,
+        )
+
+        for status in PROJECT_STATUSES:
+            styled_subheader(status, size=20, margin=0, padding=5)
+            project_hours = project_index.project_hours(
+                project, status, st.session_state["week_strs"]
+            )
+            if project_hours.empty:
+                st.info(f"No {status.lower()} hours in the selected weeks..")
+            else:
+                st.dataframe(
+                    project_hours, hide_index=True, use_container_width=True
+                )
+    else:
+        st.info("No projects submitted yet..")
+
+record_render_time(_script_start)
+start_background_prewarm()
+
+# Warm the views of the neighbouring employees and week windows for the next rerun
+prefetcher.prefetch(
+    neighbour_requests(employees, selected, week_dates), data_version, data_frames
+)
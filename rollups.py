@@ -0,0 +1,158 @@
+import pandas as pd
+
+from calendars import office_fractions
+
+DEFAULT_OFFICE = "Other"
+DEFAULT_TEAM = "Unassigned"
+COMPANY = "Company"
+
+
+class RollupCache:
+    """
+    Office -> Team -> Person weekly hours with cached totals at every level.
+
+    Person rows are built once from the entries store; team, office and company
+    totals are kept alongside and updated by the difference whenever one person's
+    entries change, so no level needs a groupby over all raw entries.
+    Attributes:
+        person (pd.DataFrame): Name x week hours.
+        team (pd.DataFrame): (Office, Team) x week hours.
+        office (pd.DataFrame): Office x week hours.
+        company (pd.Series): Week -> hours.
+        members (pd.DataFrame): Office, Team and WeeklyHours of every person.
+        mtime (tuple | None): Modification times of the files the cache reflects.
+    Methods:
+        update_person(name, person_entries_df):
+            Replaces one person's hours and adjusts the totals above them.
+        view(weeks, week_dates, office=None, team=None):
+            Hours and utilization of one level of the hierarchy.
+    """
+
+    def __init__(self, entries_df, employees_df, mtime=None):
+        self.mtime = mtime
+        self.members = (
+            employees_df.drop_duplicates("Name")
+            .set_index("Name")
+            .reindex(columns=["Office", "Team", "WeeklyHours"])
+        )
+        self.members["Office"] = self.members["Office"].fillna(DEFAULT_OFFICE)
+        self.members["Team"] = self.members["Team"].fillna(DEFAULT_TEAM)
+        self.members["WeeklyHours"] = pd.to_numeric(
+            self.members["WeeklyHours"], errors="coerce"
+        ).fillna(0)
+
+        self.person = entries_df.pivot_table(
+            index="Name", columns="Week", values="Hours", aggfunc="sum", fill_value=0
+        )
+        self.person.columns.name = None
+        for name in self.person.index.difference(self.members.index):
+            self._add_member(name)
+        self.person = self.person.reindex(self.members.index, fill_value=0)
+
+        keyed = self.person.join(self.members[["Office", "Team"]])
+        self.team = keyed.groupby(["Office", "Team"]).sum()
+        self.office = self.team.groupby(level="Office").sum()
+        self.company = self.office.sum()
+
+    def _add_member(self, name):
+        self.members.loc[name] = [DEFAULT_OFFICE, DEFAULT_TEAM, 0.0]
+
+    def _ensure_weeks(self, weeks):
+        new_weeks = [week for week in weeks if week not in self.person.columns]
+        if not new_weeks:
+            return
+        columns = list(self.person.columns) + new_weeks
+        self.person = self.person.reindex(columns=columns, fill_value=0)
+        self.team = self.team.reindex(columns=columns, fill_value=0)
+        self.office = self.office.reindex(columns=columns, fill_value=0)
+        self.company = self.company.reindex(columns, fill_value=0)
+
+    def update_person(self, name, person_entries_df):
+        """
+        Replaces one person's weekly hours and applies the difference to their
+        team, office and the company total.
+
+        Args:
+            name (str): Employee name.
+            person_entries_df (pd.DataFrame): All entries of the employee after the save.
+        """
+        hours = person_entries_df.groupby("Week")["Hours"].sum()
+        self._ensure_weeks(list(hours.index))
+        if name not in self.members.index:
+            self._add_member(name)
+        if name not in self.person.index:
+            self.person.loc[name] = 0.0
+
+        new = hours.reindex(self.person.columns, fill_value=0).astype(float)
+        delta = new - self.person.loc[name]
+        self.person.loc[name] = new
+
+        office, team = self.members.loc[name, ["Office", "Team"]]
+        if (office, team) not in self.team.index:
+            self.team.loc[(office, team), :] = 0.0
+        if office not in self.office.index:
+            self.office.loc[office] = 0.0
+        self.team.loc[(office, team)] += delta
+        self.office.loc[office] += delta
+        self.company += delta
+
+    def _capacity(self, offices, weekly_hours, weeks, week_dates):
+        fractions = office_fractions(list(offices), week_dates)
+        return pd.DataFrame(
+            fractions * weekly_hours.to_numpy()[:, None], columns=weeks
+        )
+
+    def view(self, weeks, week_dates, office=None, team=None):
+        """
+        Hours and utilization of the children of one node, plus the node's total.
+
+        With no office the rows are offices and the company total, with an office
+        they are its teams, and with a team they are its members.
+
+        Args:
+            weeks (list[str]): Week strings to show.
+            week_dates (list[date]): Dates of those weeks, for the office calendars.
+            office (str, optional): Office to drill into.
+            team (str, optional): Team to drill into (requires `office`).
+
+        Returns:
+            tuple[pd.DataFrame, pd.DataFrame]: Hours and utilization %, each with a
+                                               'Name' column and one column per week.
+        """
+        self._ensure_weeks(weeks)
+        members = self.members
+        if office is None:
+            hours = self.office[weeks]
+            total_name, total = COMPANY, self.company[weeks]
+            groups = members.groupby("Office")["WeeklyHours"].sum()
+            offices = groups.index
+        elif team is None:
+            hours = self.team.loc[office][weeks]
+            total_name, total = office, self.office.loc[office, weeks]
+            groups = members[members["Office"] == office].groupby("Team")["WeeklyHours"].sum()
+            offices = [office] * len(groups)
+        else:
+            in_team = members[(members["Office"] == office) & (members["Team"] == team)]
+            hours = self.person.loc[in_team.index, weeks]
+            total_name, total = team, self.team.loc[(office, team), weeks]
+            groups = in_team["WeeklyHours"]
+            offices = in_team["Office"]
+
+        hours = hours.reindex(groups.index, fill_value=0)
+        capacity = self._capacity(offices, groups, weeks, week_dates)
+        capacity.index = groups.index
+        capacity.loc[total_name] = capacity.sum()
+        hours = pd.concat([hours, total.to_frame(total_name).T])
+
+        utilization = (hours / capacity.replace(0, float("nan")) * 100).round(1)
+        hours = hours.rename_axis("Name").reset_index()
+        utilization = utilization.rename_axis("Name").reset_index()
+        return hours, utilization
+
+    def offices(self):
+        return sorted(self.office.index)
+
+    def teams(self, office):
+        if office not in self.team.index.get_level_values("Office"):
+            return []
+        return sorted(self.team.loc[office].index)
@@ -0,0 +1,304 @@
+"""
+Versioned snapshots of the plan, stored as deltas.
+
+Every save records only the keys whose values changed since the previous
+snapshot, with their value before and after. Any past state can be rebuilt
+by replaying deltas, and the diff between two snapshots is composed from the
+deltas in between, so its cost follows the number of changes, not the size
+of the plan.
+
+Layout of a store directory:
+    manifest.csv   Id, Timestamp and number of changes of every snapshot
+    head.csv       State as of the latest snapshot
+    000001.csv     Delta of snapshot 1 (the baseline, every key is "added")
+    000002.csv     ...
+
+Usage:
+    python snapshots.py list
+    python snapshots.py diff 3 7
+    python snapshots.py diff --since 2026-10-12
+    python snapshots.py show 3 --out plan_v3.csv
+"""
+
+import argparse
+import os
+import threading
+
+import pandas as pd
+
+from utils import save_csv
+
+SNAPSHOTS_DIR = "data/snapshots"
+MANIFEST_COLUMNS = ["Id", "Timestamp", "Changes"]
+
+# Sessions save from their own threads; ids come from a read-modify-write of the manifest
+_record_lock = threading.RLock()
+
+
+class SnapshotStore:
+    """
+    Delta-compressed history of one data file.
+    Attributes:
+        directory (str): Folder holding the manifest, head and delta files.
+        keys (list[str]): Columns identifying a row.
+        values (list[str]): Columns tracked for changes.
+        agg (str): How duplicate keys are collapsed before comparing ("sum" or "last").
+        defaults (dict): Value of every tracked column for a missing key. Rows holding only
+                         defaults are not stored, so a zero-hour row equals no row.
+    Methods:
+        ensure_baseline(df):
+            Records `df` as the first snapshot if the store is empty.
+        record(df):
+            Stores the changes of `df` against the latest snapshot.
+        rebuild(snapshot_id):
+            Returns the full state as of a snapshot.
+        diff(old_id, new_id):
+            Returns the keys that changed between two snapshots.
+    """
+
+    def __init__(self, directory, keys, values, agg="last", defaults=None):
+        self.directory = directory
+        self.keys = keys
+        self.values = values
+        self.agg = agg
+        self.defaults = defaults or {}
+
+    # ---- Files ----
+    @property
+    def manifest_file(self):
+        return os.path.join(self.directory, "manifest.csv")
+
+    @property
+    def head_file(self):
+        return os.path.join(self.directory, "head.csv")
+
+    def delta_file(self, snapshot_id):
+        return os.path.join(self.directory, f"{int(snapshot_id):06d}.csv")
+
+    def _read(self, file, columns):
+        if not os.path.exists(file):
+            return pd.DataFrame(columns=columns)
+        return pd.read_csv(file, dtype={key: str for key in self.keys})[columns]
+
+    def manifest(self):
+        if not os.path.exists(self.manifest_file):
+            return pd.DataFrame(columns=MANIFEST_COLUMNS)
+        return pd.read_csv(self.manifest_file)
+
+    def head_id(self):
+        manifest = self.manifest()
+        return int(manifest["Id"].iloc[-1]) if not manifest.empty else 0
+
+    # ---- Recording ----
+    def collapse(self, df):
+        """
+        Reduces a table to one row per key with normalised values.
+        """
+        df = df.reindex(columns=self.keys + self.values).dropna(subset=self.keys)
+        df = df.astype({key: str for key in self.keys})
+        df = df.replace("", None)
+        df = df.groupby(self.keys, sort=False, as_index=False).agg(
+            {value: self.agg for value in self.values}
+        )
+        return self._drop_defaults(df)
+
+    def _drop_defaults(self, df):
+        if not self.defaults or set(self.defaults) != set(self.values):
+            return df
+        is_default = pd.Series(True, index=df.index)
+        for value, default in self.defaults.items():
+            is_default &= df[value].fillna(default) == default
+        return df[~is_default].reset_index(drop=True)
+
+    def _delta(self, old, new):
+        merged = old.merge(
+            new, on=self.keys, how="outer", suffixes=("_Before", "_After"), indicator=True
+        )
+        before = [f"{value}_Before" for value in self.values]
+        after = [f"{value}_After" for value in self.values]
+        same = pd.Series(True, index=merged.index)
+        for b, a in zip(before, after):
+            same &= (merged[b] == merged[a]) | (merged[b].isna() & merged[a].isna())
+
+        merged["Change"] = merged["_merge"].map(
+            {"left_only": "removed", "right_only": "added", "both": "changed"}
+        ).astype(str)
+        merged = merged[(merged["_merge"] != "both") | ~same]
+        return merged[self.keys + ["Change"] + before + after].reset_index(drop=True)
+
+    def _write(self, delta, state):
+        os.makedirs(self.directory, exist_ok=True)
+        snapshot_id = self.head_id() + 1
+        save_csv(delta, self.delta_file(snapshot_id))
+        save_csv(state, self.head_file)
+        entry = pd.DataFrame(
+            [[snapshot_id, pd.Timestamp.now().isoformat(timespec="seconds"), len(delta)]],
+            columns=MANIFEST_COLUMNS,
+        )
+        save_csv(pd.concat([self.manifest(), entry], ignore_index=True), self.manifest_file)
+        return snapshot_id
+
+    def ensure_baseline(self, df):
+        """
+        Records `df` as snapshot 1 when the store has no snapshots yet.
+        """
+        with _record_lock:
+            if self.head_id() == 0:
+                return self.record(df)
+            return None
+
+    def record(self, df):
+        """
+        Records the changes of `df` against the latest snapshot.
+
+        Returns:
+            int | None: The new snapshot id, or None if nothing changed.
+        """
+        state = self.collapse(df)
+        with _record_lock:
+            head = self._drop_defaults(self._read(self.head_file, self.keys + self.values))
+            delta = self._delta(head, state)
+            if delta.empty and self.head_id() > 0:
+                return None
+            return self._write(delta, state)
+
+    # ---- Reading ----
+    def _deltas(self, first_id, last_id):
+        deltas = [
+            self._read(
+                self.delta_file(i),
+                self.keys
+                + ["Change"]
+                + [f"{v}_Before" for v in self.values]
+                + [f"{v}_After" for v in self.values],
+            )
+            for i in range(first_id, last_id + 1)
+        ]
+        deltas = [delta for delta in deltas if not delta.empty]
+        if not deltas:
+            return None
+        return pd.concat(deltas, ignore_index=True)
+
+    def rebuild(self, snapshot_id):
+        """
+        Rebuilds the full state as of a snapshot by replaying its deltas.
+
+        Returns:
+            pd.DataFrame: One row per key with the tracked values.
+        """
+        deltas = self._deltas(1, snapshot_id)
+        if deltas is None:
+            return pd.DataFrame(columns=self.keys + self.values)
+        latest = deltas.drop_duplicates(self.keys, keep="last")
+        latest = latest[latest["Change"] != "removed"]
+        latest = latest.rename(columns={f"{v}_After": v for v in self.values})
+        return latest[self.keys + self.values].reset_index(drop=True)
+
+    def diff(self, old_id, new_id=None):
+        """
+        Returns what changed between two snapshots.
+
+        Only the deltas recorded after `old_id` up to `new_id` are read.
+
+        Returns:
+            pd.DataFrame: Keys, 'Change' (added, removed or changed) and the values before
+                          and after, for every key that differs between the two snapshots.
+        """
+        if new_id is None:
+            new_id = self.head_id()
+        before = [f"{v}_Before" for v in self.values]
+        after = [f"{v}_After" for v in self.values]
+        deltas = self._deltas(old_id + 1, new_id)
+        if deltas is None:
+            return pd.DataFrame(columns=self.keys + ["Change"] + before + after)
+
+        first = deltas.drop_duplicates(self.keys, keep="first").set_index(self.keys)
+        last = (
+            deltas.drop_duplicates(self.keys, keep="last")
+            .set_index(self.keys)
+            .reindex(first.index)
+        )
+        existed = first["Change"] != "added"
+        exists = last["Change"] != "removed"
+
+        diff = pd.concat([first[before], last[after]], axis=1)
+        diff["Change"] = "changed"
+        diff.loc[~existed & exists, "Change"] = "added"
+        diff.loc[existed & ~exists, "Change"] = "removed"
+
+        same = existed == exists
+        if self.defaults:
+            # A missing key holds the defaults, e.g. a dropped zero row is still 0 hours
+            diff = diff.fillna(
+                {
+                    f"{value}_{side}": default
+                    for value, default in self.defaults.items()
+                    for side in ("Before", "After")
+                }
+            )
+            same = pd.Series(True, index=diff.index)
+        for b, a in zip(before, after):
+            same &= (diff[b] == diff[a]) | (diff[b].isna() & diff[a].isna())
+        diff = diff[(existed | exists) & ~same]
+        return diff.reset_index()[self.keys + ["Change"] + before + after]
+
+    def snapshot_at(self, timestamp):
+        """
+        Returns the id of the latest snapshot taken at or before `timestamp` (0 if none).
+        """
+        manifest = self.manifest()
+        taken = pd.to_datetime(manifest["Timestamp"]) <= pd.Timestamp(timestamp)
+        return int(manifest.loc[taken, "Id"].iloc[-1]) if taken.any() else 0
+
+
+ENTRY_SNAPSHOTS = SnapshotStore(
+    os.path.join(SNAPSHOTS_DIR, "entries"),
+    keys=["Name", "Status", "Project", "Week"],
+    values=["Hours"],
+    agg="sum",
+    defaults={"Hours": 0.0},
+)
+SKILL_SNAPSHOTS = SnapshotStore(
+    os.path.join(SNAPSHOTS_DIR, "skills"),
+    keys=["Name", "Category", "Skill"],
+    values=["Level", "LastUpdated"],
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect plan snapshots.")
+    parser.add_argument(
+        "--store", choices=["entries", "skills"], default="entries", help="Snapshot store"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="List snapshots")
+    diff_parser = commands.add_parser("diff", help="Show changes between two snapshots")
+    diff_parser.add_argument("old", type=int, nargs="?", help="Older snapshot id")
+    diff_parser.add_argument("new", type=int, nargs="?", help="Newer snapshot id (default: latest)")
+    diff_parser.add_argument("--since", help="Diff from the last snapshot at or before this date")
+    show_parser = commands.add_parser("show", help="Rebuild the plan of a snapshot")
+    show_parser.add_argument("id", type=int)
+    show_parser.add_argument("--out", help="Write the rebuilt plan to this CSV")
+    args = parser.parse_args()
+
+    store = ENTRY_SNAPSHOTS if args.store == "entries" else SKILL_SNAPSHOTS
+    if args.command == "list":
+        print(store.manifest().to_string(index=False))
+    elif args.command == "diff":
+        if args.since:
+            old = store.snapshot_at(args.since)
+        elif args.old is not None:
+            old = args.old
+        else:
+            parser.error("diff needs an old snapshot id or --since")
+        print(store.diff(old, args.new).to_string(index=False))
+    elif args.command == "show":
+        plan = store.rebuild(args.id)
+        if args.out:
+            save_csv(plan, args.out)
+        else:
+            print(plan.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,71 @@ import os, sys
 import pandas as pd
 import numpy as np
 import hashlib
+import stat
+import tempfile
+import time
+from datetime import date, timedelta
+
+# ---- DATA FILES ----
+ENTRIES_FILE = "data/entries.csv"
+SKILLS_FILE = "data/skills.csv"
+EMPLOYEES_FILE = "data/employees.csv"
+SKILLS_TEMPLATE_FILE = "data/skills_template.csv"
+
+ENTRIES_COLUMNS = ["Name", "Row", "Week", "Project", "Hours", "Status"]
+SKILLS_COLUMNS = ["Name", "Category", "Skill", "Level", "LastUpdated"]
+EMPLOYEES_COLUMNS = ["Name", "Office", "WeeklyHours", "Team"]
+STATUSES = ["Confirmed", "Tentative", "BD", "Leave"]
+
+# Parsed copies of the data files, reused while the CSV is unchanged
+CACHE_DIR = "data/.cache"
+CACHED_FILES = [ENTRIES_FILE, SKILLS_FILE, EMPLOYEES_FILE, SKILLS_TEMPLATE_FILE]
+STARTUP_LOG_FILE = "data/startup_times.csv"
+
+# Read once at import, os.umask can only be read by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+_first_render_logged = False
+
+
+def read_csv_cached(file):
+    """
+    Reads a CSV, reusing the pickled parse in `CACHE_DIR` while the file is unchanged.
+
+    Only the data files in `CACHED_FILES` are cached; other files are parsed directly.
+    """
+    if os.path.abspath(file) not in {os.path.abspath(f) for f in CACHED_FILES}:
+        return pd.read_csv(file)
+
+    stat = os.stat(file)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cache_file = os.path.join(CACHE_DIR, os.path.basename(file) + ".pkl")
+    if os.path.exists(cache_file):
+        try:
+            cached_signature, df = pd.read_pickle(cache_file)
+            if cached_signature == signature:
+                return df
+        except Exception:
+            pass  # Unreadable cache, parse the CSV again
+
+    df = pd.read_csv(file)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    fd, tmp_file = tempfile.mkstemp(suffix=".tmp", dir=CACHE_DIR)
+    os.close(fd)
+    try:
+        pd.to_pickle((signature, df), tmp_file)
+        os.replace(tmp_file, cache_file)
+    finally:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+    return df
 
 
 def load_csv(file, columns):
     if os.path.exists(file):
         try:
-            df = pd.read_csv(file)
+            df = read_csv_cached(file)
             for col in columns:
                 if col not in df.columns:
                     df[col] = None
@@ -19,7 +78,44 @@ def load_csv(file, columns):
 
 
 def save_csv(df, file):
-    df.to_csv(file, index=False)
+    # Write to a temporary file next to the target and swap it in, so readers
+    # never see a half-written file
+    directory = os.path.dirname(os.path.abspath(file))
+    fd, tmp_file = tempfile.mkstemp(suffix=".tmp", dir=directory)
+    os.close(fd)
+    try:
+        df.to_csv(tmp_file, index=False)
+        # mkstemp creates the file as 0600, keep the target readable as before
+        if os.path.exists(file):
+            os.chmod(tmp_file, stat.S_IMODE(os.stat(file).st_mode))
+        else:
+            os.chmod(tmp_file, 0o666 & ~_UMASK)
+        os.replace(tmp_file, file)
+    finally:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+
+
+def file_mtime(file):
+    return os.path.getmtime(file) if os.path.exists(file) else None
+
+
+# ---- Week Window ----
+def current_monday():
+    today = date.today()
+    return today - timedelta(days=today.weekday())
+
+
+def week_window(n_weeks, start=0):
+    """
+    Mondays of `n_weeks` consecutive weeks, starting `start` weeks from the current week.
+    """
+    base_monday = current_monday()
+    return [base_monday + timedelta(weeks=start + i) for i in range(n_weeks)]
+
+
+def default_week_strs(n_weeks=12):
+    return [week.strftime("%d-%b") for week in week_window(n_weeks)]
 
 
 def pivot_entries(df, status, weeks):
@@ -46,6 +142,8 @@ def pivot_entries(df, status, weeks):
     pivot = (
         pivot.set_index("Project").reindex(filtered["Project"].unique()).reset_index()
     )
+    # Weeks without a stored row (e.g. dropped zero-hour rows) show as 0
+    pivot[weeks] = pivot[weeks].fillna(0)
     pivot["Project"] = pivot["Project"].astype(str)  # Ensure "Project" column is string
     return (
         pivot[["Project"] + weeks]
@@ -72,3 +170,35 @@ def sum_hours(df, weeks):
     # Only sum numeric columns (the week columns)
     week_cols = [col for col in df.columns if col in weeks]
     return df[week_cols].replace(np.nan, 0).astype(float).sum(axis=0)
+
+
+# --- Startup Timing ---
+def log_startup_time(stage, seconds):
+    pd.DataFrame(
+        [[pd.Timestamp.now().isoformat(timespec="seconds"), stage, round(seconds, 3)]],
+        columns=["Timestamp", "Stage", "Seconds"],
+    ).to_csv(
+        STARTUP_LOG_FILE,
+        mode="a",
+        header=not os.path.exists(STARTUP_LOG_FILE),
+        index=False,
+    )
+
+
+def record_render_time(start):
+    """
+    Prints how long the script run took since `start` (a `time.perf_counter()` value).
+
+    The first run in the process includes the heavy imports and first CSV parse,
+    so it is also appended to `STARTUP_LOG_FILE` as the time to first render.
+    """
+    global _first_render_logged
+    elapsed = time.perf_counter() - start
+    if _first_render_logged:
+        print(f"⏱️ Rendered in {elapsed:.2f}s")
+        return elapsed
+
+    _first_render_logged = True
+    print(f"⏱️ First render in {elapsed:.2f}s")
+    log_startup_time("first_render", elapsed)
+    return elapsed